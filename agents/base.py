@@ -6,13 +6,17 @@ inherit from, implementing core A2A protocol functionality.
 """
 
 import asyncio
+import copy
+import hashlib
 import logging
 import time
 from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Set
+from collections import OrderedDict, deque
+from datetime import datetime, timedelta
+from typing import Any, Deque, Dict, FrozenSet, List, Optional, Set, Tuple
 from uuid import uuid4
 
+import orjson
 import structlog
 from pydantic import BaseModel
 from fasta2a import FastA2A, Skill
@@ -25,9 +29,6 @@ from models.a2a import (
     AgentMetrics,
     AgentStatus,
     A2AMessage,
-    A2ARequest,
-    A2AResponse,
-    A2AError,
     A2ATask,
     Capability,
     MessageType,
@@ -64,6 +65,16 @@ class BaseAgent(CapabilityDiscoveryMixin, ABC):
     - Error handling and recovery
     """
 
+    # Maximum number of finished tasks kept in memory for status queries
+    max_finished_tasks: int = 10_000
+    # Refresh interval in seconds for the coarse clock used for task timestamps
+    clock_resolution: float = 0.01
+    # Capabilities whose results depend only on their parameters; repeated calls
+    # are answered from the result cache without running the capability again
+    memoized_capabilities: FrozenSet[str] = frozenset()
+    result_cache_size: int = 1024
+    result_cache_ttl: float = 3600.0
+
     def __init__(
         self,
         agent_id: str,
@@ -97,7 +108,14 @@ class BaseAgent(CapabilityDiscoveryMixin, ABC):
         # Agent state
         self._status = AgentStatus.INITIALIZING
         self._capabilities: Dict[str, Capability] = {}
+        # Serialized capabilities, rebuilt only after a capability changes
+        self._capabilities_dump: Optional[List[Dict[str, Any]]] = None
+        self._capability_dumps: Dict[str, Dict[str, Any]] = {}
         self._active_tasks: Dict[str, A2ATask] = {}
+        # Finished tasks in completion order, so cleanup only touches expired ones
+        self._finished_tasks: Deque[Tuple[datetime, str]] = deque()
+        # Memoized results by call fingerprint, least recently used first
+        self._result_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
         self._metrics = AgentMetrics()
         self._start_time = time.time()
         
@@ -109,6 +127,9 @@ class BaseAgent(CapabilityDiscoveryMixin, ABC):
         
         # Background tasks
         self._background_tasks: Set[asyncio.Task] = set()
+        # Coarse UTC clock refreshed by _clock_loop while the agent is running
+        self._clock: Optional[datetime] = None
+        self._clock_iso: Optional[str] = None  # _clock formatted once per tick
         
         # Logging
         self.logger = structlog.get_logger(__name__).bind(
@@ -150,7 +171,7 @@ class BaseAgent(CapabilityDiscoveryMixin, ABC):
         """Get current agent metrics"""
         self._metrics.uptime_seconds = int(time.time() - self._start_time)
         self._metrics.concurrent_tasks = len(self._active_tasks)
-        self._metrics.last_activity = datetime.utcnow()
+        self._metrics.last_activity = self._utcnow()
         return self._metrics
 
     def register_capability(self, capability: Capability) -> None:
@@ -161,6 +182,7 @@ class BaseAgent(CapabilityDiscoveryMixin, ABC):
             capability: Capability definition
         """
         self._capabilities[capability.name] = capability
+        self._capabilities_dump = None
         self.logger.info(
             "Capability registered",
             capability_name=capability.name,
@@ -179,6 +201,18 @@ class BaseAgent(CapabilityDiscoveryMixin, ABC):
         """Check if agent has a specific capability"""
         return name in self._capabilities
 
+    def _dump_capabilities(self) -> List[Dict[str, Any]]:
+        """Get serialized capabilities, reusing the cached dump when unchanged"""
+        if self._capabilities_dump is None:
+            self._capability_dumps = {name: cap.model_dump() for name, cap in self._capabilities.items()}
+            self._capabilities_dump = list(self._capability_dumps.values())
+        return self._capabilities_dump
+
+    def _dump_capability(self, name: str) -> Dict[str, Any]:
+        """Get one serialized capability from the same cached dump"""
+        self._dump_capabilities()
+        return self._capability_dumps[name]
+
     async def start(self) -> None:
         """Start the agent and A2A communication"""
         try:
@@ -197,6 +231,8 @@ class BaseAgent(CapabilityDiscoveryMixin, ABC):
             register_message_handler(self.agent_id, self._handle_incoming_message)
             
             # Start background tasks
+            clock_task = asyncio.create_task(self._clock_loop())
+            self._background_tasks.add(clock_task)
             heartbeat_task = asyncio.create_task(self._heartbeat_loop())
             cleanup_task = asyncio.create_task(self._cleanup_loop())
             self._background_tasks.add(heartbeat_task)
@@ -318,17 +354,31 @@ class BaseAgent(CapabilityDiscoveryMixin, ABC):
             if not capability:
                 raise ValueError(f"Unknown capability: {capability_name}")
             
+            # Serve repeated calls of pure capabilities from the result cache
+            fingerprint = None
+            if capability_name in self.memoized_capabilities:
+                fingerprint = self._result_fingerprint(capability, parameters)
+                cached_result = self._get_cached_result(fingerprint)
+                if cached_result is not None:
+                    self._metrics.successful_requests += 1
+                    self._update_average_response_time((time.time() - start_time) * 1000)
+                    self.logger.debug("Capability result served from cache", capability=capability_name)
+                    return cached_result
+            
             # Check if agent is busy and capability allows concurrent execution
             if (self._status == AgentStatus.BUSY and 
                 len(self._running_tasks) >= capability.max_concurrent):
                 raise RuntimeError("Agent is at maximum capacity")
             
-            # Create task
+            # Create task already in progress, stamped with a single clock read
+            now = self._utcnow()
             task = A2ATask(
                 capability=capability_name,
                 parameters=parameters,
+                status=TaskStatus.IN_PROGRESS,
                 assigned_agent=self.agent_id,
-                started_at=datetime.utcnow()
+                created_at=now,
+                started_at=now
             )
             
             self._active_tasks[task.task_id] = task
@@ -349,8 +399,11 @@ class BaseAgent(CapabilityDiscoveryMixin, ABC):
             
             # Update task
             task.status = TaskStatus.COMPLETED
-            task.completed_at = datetime.utcnow()
+            task.completed_at = self._utcnow()
             task.result = result
+            self._record_finished_task(task)
+            if fingerprint is not None:
+                self._store_result(fingerprint, result)
             
             # Update metrics
             execution_time = (time.time() - start_time) * 1000
@@ -371,7 +424,8 @@ class BaseAgent(CapabilityDiscoveryMixin, ABC):
             if 'task' in locals():
                 task.status = TaskStatus.FAILED
                 task.error = str(e)
-                task.completed_at = datetime.utcnow()
+                task.completed_at = self._utcnow()
+                self._record_finished_task(task)
             
             self._metrics.failed_requests += 1
             
@@ -391,6 +445,45 @@ class BaseAgent(CapabilityDiscoveryMixin, ABC):
             if len(self._running_tasks) == 0:
                 self._status = AgentStatus.READY
 
+    def invalidate_capability_result(self, capability_name: str, parameters: Dict[str, Any]) -> None:
+        """Drop the memoized result of one call, e.g. after the data behind it changed"""
+        capability = self.get_capability(capability_name)
+        if capability:
+            fingerprint = self._result_fingerprint(capability, parameters)
+            if fingerprint is not None:
+                self._result_cache.pop(fingerprint, None)
+
+    def _result_fingerprint(self, capability: Capability, parameters: Dict[str, Any]) -> Optional[str]:
+        """Fingerprint a call by capability name, version and canonical parameters"""
+        try:
+            canonical = orjson.dumps(
+                [capability.name, capability.version, parameters], option=orjson.OPT_SORT_KEYS
+            )
+        except TypeError:
+            # Parameters that are not plain JSON are never memoized
+            return None
+        return hashlib.blake2b(canonical, digest_size=16).hexdigest()
+
+    def _get_cached_result(self, fingerprint: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Get a fresh memoized result as a private copy the caller may mutate"""
+        cached = self._result_cache.get(fingerprint) if fingerprint is not None else None
+        if cached is None:
+            return None
+        stored_at, result = cached
+        if time.monotonic() - stored_at > self.result_cache_ttl:
+            del self._result_cache[fingerprint]
+            return None
+        self._result_cache.move_to_end(fingerprint)
+        return copy.deepcopy(result)
+
+    def _store_result(self, fingerprint: str, result: Dict[str, Any]) -> None:
+        """Memoize a snapshot of a result, evicting the least recently used beyond result_cache_size"""
+        # Deep copies rather than JSON bytes so non-JSON values such as datetimes keep their type
+        self._result_cache[fingerprint] = (time.monotonic(), copy.deepcopy(result))
+        self._result_cache.move_to_end(fingerprint)
+        while len(self._result_cache) > self.result_cache_size:
+            self._result_cache.popitem(last=False)
+
     # Abstract methods that subclasses must implement
 
     @abstractmethod
@@ -416,12 +509,30 @@ class BaseAgent(CapabilityDiscoveryMixin, ABC):
 
     def _setup_message_handlers(self) -> None:
         """Setup message type handlers"""
+        # Legacy messages are converted and handled by the JSON-RPC path
         self._message_handlers = {
-            MessageType.REQUEST: self._handle_request,
-            MessageType.RESPONSE: self._handle_response,
-            MessageType.ERROR: self._handle_error,
-            MessageType.NOTIFICATION: self._handle_notification,
-            MessageType.HEARTBEAT: self._handle_heartbeat,
+            message_type: self._handle_legacy_message
+            for message_type in (
+                MessageType.REQUEST,
+                MessageType.RESPONSE,
+                MessageType.ERROR,
+                MessageType.NOTIFICATION,
+                MessageType.HEARTBEAT,
+            )
+        }
+        self._request_handlers = {
+            A2AMethod.EXECUTE_CAPABILITY: self._handle_capability_execution_request,
+            A2AMethod.LIST_CAPABILITIES: self._handle_list_capabilities_request,
+            A2AMethod.GET_CAPABILITY_INFO: self._handle_capability_info_request,
+            A2AMethod.GET_AGENT_INFO: self._handle_agent_info_request,
+            A2AMethod.GET_AGENT_STATUS: self._handle_agent_status_request,
+            A2AMethod.HEARTBEAT: self._handle_heartbeat_request,
+        }
+        self._notification_handlers = {
+            A2AMethod.HEARTBEAT: self._handle_heartbeat_notification,
+            A2AMethod.TASK_STATUS_CHANGED: self._handle_task_status_notification,
+            A2AMethod.AGENT_STATUS_CHANGED: self._handle_agent_status_notification,
+            A2AMethod.CAPABILITY_UPDATED: self._handle_capability_updated_notification,
         }
 
     async def _setup_a2a(self) -> None:
@@ -457,6 +568,25 @@ class BaseAgent(CapabilityDiscoveryMixin, ABC):
             self.logger.error("Failed to setup A2A communication", error=str(e))
             raise
 
+    def _utcnow(self) -> datetime:
+        """Get the current UTC time, from the coarse clock when it is running"""
+        return self._clock or datetime.utcnow()
+
+    def _utcnow_iso(self) -> str:
+        """Get the current UTC time as ISO 8601, formatted once per clock tick"""
+        return self._clock_iso or datetime.utcnow().isoformat()
+
+    async def _clock_loop(self) -> None:
+        """Periodically refresh the coarse clock used for task timestamps"""
+        try:
+            while self._status != AgentStatus.OFFLINE:
+                self._clock = datetime.utcnow()
+                self._clock_iso = self._clock.isoformat()
+                await asyncio.sleep(self.clock_resolution)
+        finally:
+            self._clock = None
+            self._clock_iso = None
+
     async def _heartbeat_loop(self) -> None:
         """Send periodic heartbeat messages"""
         while self._status != AgentStatus.OFFLINE:
@@ -486,28 +616,33 @@ class BaseAgent(CapabilityDiscoveryMixin, ABC):
 
     async def _cleanup_expired_tasks(self) -> None:
         """Remove expired and completed tasks"""
-        current_time = datetime.utcnow()
-        expired_tasks = []
+        # Remove completed tasks older than 1 hour; finished tasks are queued
+        # in completion order so we can stop at the first one still fresh
+        cutoff = self._utcnow() - timedelta(hours=1)
+        expired_count = 0
         
-        for task_id, task in self._active_tasks.items():
-            # Remove completed tasks older than 1 hour
-            if (task.status in [TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED] and
-                task.completed_at and 
-                (current_time - task.completed_at).total_seconds() > 3600):
-                expired_tasks.append(task_id)
-        
-        for task_id in expired_tasks:
-            del self._active_tasks[task_id]
+        while self._finished_tasks and self._finished_tasks[0][0] < cutoff:
+            _, task_id = self._finished_tasks.popleft()
+            if self._active_tasks.pop(task_id, None) is not None:
+                expired_count += 1
             
-        if expired_tasks:
-            self.logger.debug("Cleaned up expired tasks", count=len(expired_tasks))
+        if expired_count:
+            self.logger.debug("Cleaned up expired tasks", count=expired_count)
+
+    def _record_finished_task(self, task: A2ATask) -> None:
+        """Queue a finished task for expiry, evicting the oldest beyond the cap"""
+        self._finished_tasks.append((task.completed_at, task.task_id))
+        while len(self._finished_tasks) > self.max_finished_tasks:
+            _, task_id = self._finished_tasks.popleft()
+            self._active_tasks.pop(task_id, None)
 
     async def _cancel_task(self, task_id: str) -> None:
         """Cancel an active task"""
         if task_id in self._active_tasks:
             task = self._active_tasks[task_id]
             task.status = TaskStatus.CANCELLED
-            task.completed_at = datetime.utcnow()
+            task.completed_at = self._utcnow()
+            self._record_finished_task(task)
             self._running_tasks.discard(task_id)
 
     def _update_average_response_time(self, execution_time_ms: float) -> None:
@@ -582,20 +717,10 @@ class BaseAgent(CapabilityDiscoveryMixin, ABC):
         """Handle JSON-RPC request messages"""
         try:
             method = request.method
-            params = request.params or {}
+            handler = self._request_handlers.get(method)
             
-            if method == A2AMethod.EXECUTE_CAPABILITY:
-                await self._handle_capability_execution_request(envelope, request)
-            elif method == A2AMethod.LIST_CAPABILITIES:
-                await self._handle_list_capabilities_request(envelope, request)
-            elif method == A2AMethod.GET_CAPABILITY_INFO:
-                await self._handle_capability_info_request(envelope, request)
-            elif method == A2AMethod.GET_AGENT_INFO:
-                await self._handle_agent_info_request(envelope, request)
-            elif method == A2AMethod.GET_AGENT_STATUS:
-                await self._handle_agent_status_request(envelope, request)
-            elif method == A2AMethod.HEARTBEAT:
-                await self._handle_heartbeat_request(envelope, request)
+            if handler is not None:
+                await handler(envelope, request)
             else:
                 # Unknown method
                 error_response = create_error_response(
@@ -682,7 +807,7 @@ class BaseAgent(CapabilityDiscoveryMixin, ABC):
 
     async def _handle_list_capabilities_request(self, envelope: A2AMessageEnvelope, request: JSONRPCRequest) -> None:
         """Handle list capabilities request"""
-        capabilities_data = [cap.model_dump() for cap in self.list_capabilities()]
+        capabilities_data = self._dump_capabilities()
         
         success_response = create_success_response(
             sender_id=self.agent_id,
@@ -727,18 +852,22 @@ class BaseAgent(CapabilityDiscoveryMixin, ABC):
             sender_id=self.agent_id,
             recipient_id=envelope.sender_id,
             request_id=request.id,
-            result=capability.model_dump(),
+            result=self._dump_capability(capability_name),
             correlation_id=envelope.correlation_id
         )
         await self.send_message(success_response)
 
     async def _handle_agent_info_request(self, envelope: A2AMessageEnvelope, request: JSONRPCRequest) -> None:
         """Handle agent info request"""
+        # Reuse the cached capability dump instead of re-serializing each capability
+        agent_info = self.agent_card.model_dump(exclude={"capabilities"})
+        agent_info["capabilities"] = self._dump_capabilities()
+        
         success_response = create_success_response(
             sender_id=self.agent_id,
             recipient_id=envelope.sender_id,
             request_id=request.id,
-            result=self.agent_card.model_dump(),
+            result=agent_info,
             correlation_id=envelope.correlation_id
         )
         await self.send_message(success_response)
@@ -764,7 +893,7 @@ class BaseAgent(CapabilityDiscoveryMixin, ABC):
     async def _handle_heartbeat_request(self, envelope: A2AMessageEnvelope, request: JSONRPCRequest) -> None:
         """Handle heartbeat request"""
         heartbeat_data = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": self._utcnow_iso(),
             "status": self._status.value,
             "agent_id": self.agent_id
         }
@@ -802,21 +931,15 @@ class BaseAgent(CapabilityDiscoveryMixin, ABC):
         """Handle JSON-RPC notification messages"""
         try:
             method = notification.method
-            params = notification.params or {}
-            
-            if method == A2AMethod.HEARTBEAT:
-                await self._handle_heartbeat_notification(envelope, notification)
-            elif method == A2AMethod.TASK_STATUS_CHANGED:
-                await self._handle_task_status_notification(envelope, notification)
-            elif method == A2AMethod.AGENT_STATUS_CHANGED:
-                await self._handle_agent_status_notification(envelope, notification)
-            elif method == A2AMethod.CAPABILITY_UPDATED:
-                await self._handle_capability_updated_notification(envelope, notification)
+            handler = self._notification_handlers.get(method)
+            
+            if handler is not None:
+                await handler(envelope, notification)
             else:
                 self.logger.debug(
                     "Received unknown notification",
                     method=method,
-                    params=params
+                    params=notification.params or {}
                 )
                 
         except Exception as e:
@@ -870,27 +993,7 @@ class BaseAgent(CapabilityDiscoveryMixin, ABC):
 
     # Legacy message handlers (for backward compatibility)
 
-    async def _handle_request(self, message: A2ARequest) -> None:
-        """Handle incoming request messages (legacy)"""
-        # Convert to JSON-RPC and delegate
-        pass
-
-    async def _handle_response(self, message: A2AResponse) -> None:
-        """Handle response messages (legacy)"""
-        # Convert to JSON-RPC and delegate
-        pass
-
-    async def _handle_error(self, message: A2AError) -> None:
-        """Handle error messages (legacy)"""
-        # Convert to JSON-RPC and delegate
-        pass
-
-    async def _handle_notification(self, message: A2AMessage) -> None:
-        """Handle notification messages (legacy)"""
-        # Convert to JSON-RPC and delegate
-        pass
-
-    async def _handle_heartbeat(self, message: A2AMessage) -> None:
-        """Handle heartbeat messages (legacy)"""
-        # Convert to JSON-RPC and delegate
-        pass
\ No newline at end of file
+    async def _handle_legacy_message(self, message: A2AMessage) -> None:
+        """Convert a legacy A2A message to JSON-RPC and handle it"""
+        envelope = self._message_router.converter.a2a_to_envelope(message)
+        await self._handle_incoming_message(envelope)
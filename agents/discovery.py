@@ -55,6 +55,12 @@ class CapabilityDiscoveryMixin:
         self._auto_register = True
         self._auto_heartbeat = True
         
+        # Background registration retry with exponential backoff
+        self._registration_task: Optional[asyncio.Task] = None
+        self._registration_max_retries: int = 5
+        self._registration_retry_delay: float = 1.0  # seconds, doubled per attempt
+        self._registration_max_delay: float = 60.0
+        
         # Discovery logger will be created in _setup_discovery when agent_id is available
         self.discovery_logger = None
     
@@ -71,9 +77,10 @@ class CapabilityDiscoveryMixin:
             # Use provided registry or get default
             self._registry = registry or await get_default_registry()
             
-            # Register this agent if auto-registration is enabled
-            if self._auto_register:
-                await self._register_with_registry()
+            # Register this agent if auto-registration is enabled; on failure keep
+            # retrying in the background instead of blocking agent startup
+            if self._auto_register and not await self._register_with_registry():
+                self._registration_task = asyncio.create_task(self._retry_registration())
             
             self.discovery_logger.info("Capability discovery setup complete")
             
@@ -87,6 +94,10 @@ class CapabilityDiscoveryMixin:
     async def _cleanup_discovery(self) -> None:
         """Cleanup discovery resources"""
         try:
+            if self._registration_task and not self._registration_task.done():
+                self._registration_task.cancel()
+            self._registration_task = None
+            
             if self._registry and self._auto_register:
                 await self._unregister_from_registry()
             
@@ -118,6 +129,29 @@ class CapabilityDiscoveryMixin:
             self.discovery_logger.error("Registry registration error", error=str(e))
             return False
     
+    async def _retry_registration(self) -> bool:
+        """Retry registry registration with exponential backoff"""
+        delay = self._registration_retry_delay
+        
+        for attempt in range(1, self._registration_max_retries + 1):
+            await asyncio.sleep(delay)
+            
+            if await self._register_with_registry():
+                return True
+            
+            delay = min(delay * 2, self._registration_max_delay)
+            self.discovery_logger.warning(
+                "Registry registration retry failed",
+                attempt=attempt,
+                next_delay=delay
+            )
+        
+        self.discovery_logger.error(
+            "Giving up on registry registration",
+            attempts=self._registration_max_retries
+        )
+        return False
+    
     async def _unregister_from_registry(self) -> bool:
         """Unregister this agent from the registry"""
         if not self._registry:
@@ -464,8 +498,26 @@ class CapabilityDiscoveryMixin:
     
     def _update_cache(self, cache_key: str, agents: List[AgentCard]) -> None:
         """Update cache with new agent data"""
+        now = asyncio.get_event_loop().time()
         self._discovery_cache[cache_key] = agents.copy()
-        self._cache_timestamps[cache_key] = asyncio.get_event_loop().time()
+        self._cache_timestamps[cache_key] = now
+        
+        # Seed per-agent entries so get_agent_info after discovery skips the registry
+        for agent in agents:
+            agent_key = f"agent:{agent.agent_id}"
+            self._discovery_cache[agent_key] = [agent]
+            self._cache_timestamps[agent_key] = now
+    
+    def evict_agent_from_cache(self, agent_id: str) -> None:
+        """Drop an agent from all cached discovery results, e.g. after it failed a request"""
+        self._discovery_cache.pop(f"agent:{agent_id}", None)
+        self._cache_timestamps.pop(f"agent:{agent_id}", None)
+        
+        for cache_key, cached in self._discovery_cache.items():
+            if cache_key.startswith(("capability:", "type:")):
+                self._discovery_cache[cache_key] = [agent for agent in cached if agent.agent_id != agent_id]
+        
+        self.discovery_logger.debug("Agent evicted from discovery cache", target_agent_id=agent_id)
     
     def clear_discovery_cache(self) -> None:
         """Clear all cached discovery data"""
@@ -7,13 +7,21 @@ for A2A messages using JSON-RPC 2.0 format with optional compression and encrypt
 
 import asyncio
 import gzip
-import json
+import logging
+import sys
 import time
-from typing import Any, Dict, List, Optional, Union
+import zlib
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Union
 from uuid import uuid4
 
 import structlog
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
+
+try:
+    import zstandard
+except ImportError:  # optional dependency, gzip is used without it
+    zstandard = None
 
 from models.a2a import A2AMessage, A2ARequest, A2AResponse, A2AError, MessageType
 from models.jsonrpc import (
@@ -35,6 +43,27 @@ from models.jsonrpc import (
 
 logger = structlog.get_logger(__name__)
 
+# Frame headers that identify compressed payloads
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# Validator for batches written by A2AMessageSerializer.serialize_batch
+_ENVELOPE_BATCH_ADAPTER = TypeAdapter(List[A2AMessageEnvelope])
+
+# Map A2A error codes to JSON-RPC error codes
+_ERROR_CODE_MAP: Mapping[str, JSONRPCErrorCode] = MappingProxyType({
+    "AGENT_NOT_FOUND": JSONRPCErrorCode.AGENT_NOT_FOUND,
+    "CAPABILITY_NOT_FOUND": JSONRPCErrorCode.CAPABILITY_NOT_FOUND,
+    "TIMEOUT": JSONRPCErrorCode.TIMEOUT_ERROR,
+    "VALIDATION_ERROR": JSONRPCErrorCode.VALIDATION_ERROR,
+})
+
+# Map generic A2A message types to notification methods
+_NOTIFICATION_METHOD_MAP: Mapping[MessageType, str] = MappingProxyType({
+    MessageType.HEARTBEAT: A2AMethod.HEARTBEAT,
+    MessageType.NOTIFICATION: "a2a.notify.generic",
+})
+
 
 class MessageSerializationError(Exception):
     """Raised when message serialization fails"""
@@ -59,7 +88,11 @@ class A2AMessageSerializer:
     def __init__(self, 
                  enable_compression: bool = True,
                  compression_threshold: int = 1024,
-                 enable_encryption: bool = False):
+                 enable_encryption: bool = False,
+                 compression_algorithm: str = "gzip",
+                 zstd_level: int = 3,
+                 compression_level: int = 1,
+                 offload_threshold: int = 64 * 1024):
         """
         Initialize the message serializer.
         
@@ -67,14 +100,32 @@ class A2AMessageSerializer:
             enable_compression: Whether to enable compression for large messages
             compression_threshold: Minimum message size in bytes to trigger compression
             enable_encryption: Whether to enable message encryption (not implemented yet)
+            compression_algorithm: "gzip" or "zstd" (requires the zstandard package)
+            zstd_level: Compression level used for zstd
+            compression_level: gzip level; 1 is much cheaper than the default 9 for JSON
+            offload_threshold: Minimum encoded size in bytes for serialize_message_async
+                to gzip in a worker thread instead of on the event loop
         """
         self.enable_compression = enable_compression
+        self.compression_level = compression_level
         self.compression_threshold = compression_threshold
+        self.offload_threshold = offload_threshold
         self.enable_encryption = enable_encryption
         
         self.logger = structlog.get_logger(__name__).bind(
             component="message_serializer"
         )
+        
+        # zstd contexts are reused across messages to avoid per-call setup
+        self._zstd_compressor = None
+        self._zstd_decompressor = zstandard.ZstdDecompressor() if zstandard else None
+        if compression_algorithm == "zstd":
+            if zstandard is None:
+                self.logger.warning("zstandard not installed, falling back to gzip")
+                compression_algorithm = "gzip"
+            else:
+                self._zstd_compressor = zstandard.ZstdCompressor(level=zstd_level)
+        self.compression_algorithm = compression_algorithm
     
     def serialize_message(self, envelope: A2AMessageEnvelope) -> bytes:
         """
@@ -90,29 +141,25 @@ class A2AMessageSerializer:
             MessageSerializationError: If serialization fails
         """
         try:
-            # Convert to JSON
-            envelope_dict = envelope.dict()
-            json_data = json.dumps(envelope_dict, default=self._json_serializer, separators=(',', ':'))
-            message_bytes = json_data.encode('utf-8')
-            
-            # Apply compression if enabled and message is large enough
-            if (self.enable_compression and 
-                len(message_bytes) > self.compression_threshold):
-                message_bytes = gzip.compress(message_bytes)
-                # Note: compression info is stored in envelope.compression field
+            # Encode straight to JSON bytes in pydantic-core, without an
+            # intermediate dict or str copy
+            json_bytes = type(envelope).__pydantic_serializer__.to_json(envelope)
+            message_bytes = self._compress(json_bytes)
             
             # TODO: Apply encryption if enabled
             if self.enable_encryption:
                 # Placeholder for encryption implementation
                 pass
             
-            self.logger.debug(
-                "Message serialized",
-                envelope_id=envelope.envelope_id,
-                original_size=len(json_data),
-                compressed_size=len(message_bytes),
-                compression_enabled=self.enable_compression and len(message_bytes) != len(json_data.encode('utf-8'))
-            )
+            # Skip building the log fields entirely when debug logging is off
+            if self.logger.is_enabled_for(logging.DEBUG):
+                self.logger.debug(
+                    "Message serialized",
+                    envelope_id=envelope.envelope_id,
+                    original_size=len(json_bytes),
+                    compressed_size=len(message_bytes),
+                    compression_enabled=message_bytes is not json_bytes
+                )
             
             return message_bytes
             
@@ -120,6 +167,33 @@ class A2AMessageSerializer:
             self.logger.error("Message serialization failed", error=str(e))
             raise MessageSerializationError(f"Failed to serialize message: {e}")
     
+    async def serialize_message_async(self, envelope: A2AMessageEnvelope) -> bytes:
+        """
+        Serialize an envelope, gzipping large payloads in a worker thread.
+        
+        zlib releases the GIL while it deflates, so compressing big payloads
+        off the event loop keeps other coroutines running. Small payloads and
+        zstd (whose shared compressor is not thread-safe) stay inline, where a
+        thread hand-off would cost more than the compression itself.
+        
+        Args:
+            envelope: A2A message envelope to serialize
+            
+        Returns:
+            Serialized message as bytes
+            
+        Raises:
+            MessageSerializationError: If serialization fails
+        """
+        try:
+            json_bytes = type(envelope).__pydantic_serializer__.to_json(envelope)
+            if len(json_bytes) >= self.offload_threshold and self._zstd_compressor is None:
+                return await asyncio.to_thread(self._compress, json_bytes)
+            return self._compress(json_bytes)
+        except Exception as e:
+            self.logger.error("Message serialization failed", error=str(e))
+            raise MessageSerializationError(f"Failed to serialize message: {e}")
+    
     def deserialize_message(self, message_bytes: bytes) -> A2AMessageEnvelope:
         """
         Deserialize bytes to an A2A message envelope.
@@ -139,31 +213,18 @@ class A2AMessageSerializer:
                 # Placeholder for decryption implementation
                 pass
             
-            # Handle decompression - we need to detect if it's compressed
-            try:
-                # Try to decompress first
-                decompressed_bytes = gzip.decompress(message_bytes)
-                self.logger.debug("Message decompressed", 
-                                compressed_size=len(message_bytes),
-                                decompressed_size=len(decompressed_bytes))
-                message_bytes = decompressed_bytes
-            except gzip.BadGzipFile:
-                # Not compressed, use as-is
-                pass
+            message_bytes = self._decompress(message_bytes)
             
-            # Convert from JSON
-            json_data = message_bytes.decode('utf-8')
-            envelope_dict = json.loads(json_data)
+            # Parse and validate the JSON in a single pydantic-core pass
+            envelope = A2AMessageEnvelope.model_validate_json(message_bytes)
             
-            # Deserialize to A2A message envelope
-            envelope = A2AMessageEnvelope(**envelope_dict)
-            
-            self.logger.debug(
-                "Message deserialized",
-                envelope_id=envelope.envelope_id,
-                sender_id=envelope.sender_id,
-                recipient_id=envelope.recipient_id
-            )
+            if self.logger.is_enabled_for(logging.DEBUG):
+                self.logger.debug(
+                    "Message deserialized",
+                    envelope_id=envelope.envelope_id,
+                    sender_id=envelope.sender_id,
+                    recipient_id=envelope.recipient_id
+                )
             
             return envelope
             
@@ -174,11 +235,82 @@ class A2AMessageSerializer:
             self.logger.error("Message deserialization failed", error=str(e))
             raise MessageDeserializationError(f"Failed to deserialize message: {e}")
     
-    def _json_serializer(self, obj):
-        """Custom JSON serializer for datetime and other objects"""
-        if hasattr(obj, 'isoformat'):
-            return obj.isoformat()
-        raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
+    def serialize_batch(self, envelopes: List[A2AMessageEnvelope]) -> bytes:
+        """
+        Serialize several envelopes into one JSON array, compressed once.
+        
+        Args:
+            envelopes: A2A message envelopes to serialize
+            
+        Returns:
+            Serialized batch as bytes
+            
+        Raises:
+            MessageSerializationError: If serialization fails
+        """
+        try:
+            json_bytes = b"[" + b",".join(
+                type(envelope).__pydantic_serializer__.to_json(envelope) for envelope in envelopes
+            ) + b"]"
+            message_bytes = self._compress(json_bytes)
+            
+            if self.logger.is_enabled_for(logging.DEBUG):
+                self.logger.debug(
+                    "Message batch serialized",
+                    count=len(envelopes),
+                    original_size=len(json_bytes),
+                    compressed_size=len(message_bytes)
+                )
+            
+            return message_bytes
+            
+        except Exception as e:
+            self.logger.error("Message batch serialization failed", error=str(e))
+            raise MessageSerializationError(f"Failed to serialize message batch: {e}")
+    
+    def deserialize_batch(self, message_bytes: bytes) -> List[A2AMessageEnvelope]:
+        """
+        Deserialize a batch produced by serialize_batch.
+        
+        Args:
+            message_bytes: Serialized batch bytes
+            
+        Returns:
+            Deserialized A2A message envelopes, in order
+            
+        Raises:
+            MessageDeserializationError: If deserialization fails
+        """
+        try:
+            return _ENVELOPE_BATCH_ADAPTER.validate_json(self._decompress(message_bytes))
+        except ValidationError as e:
+            self.logger.error("Message batch validation failed", error=str(e))
+            raise MessageDeserializationError(f"Message batch validation failed: {e}")
+        except Exception as e:
+            self.logger.error("Message batch deserialization failed", error=str(e))
+            raise MessageDeserializationError(f"Failed to deserialize message batch: {e}")
+    
+    def _compress(self, json_bytes: bytes) -> bytes:
+        """Compress serialized JSON if enabled and large enough"""
+        if not self.enable_compression or len(json_bytes) <= self.compression_threshold:
+            return json_bytes
+        if self._zstd_compressor is not None:
+            return self._zstd_compressor.compress(json_bytes)
+        # A single deflate call with a gzip wrapper (wbits=31) and no mtime header
+        return zlib.compress(json_bytes, self.compression_level, wbits=31)
+    
+    def _decompress(self, message_bytes: bytes) -> bytes:
+        """Decompress a payload, detecting the algorithm by its magic bytes"""
+        if self._zstd_decompressor is not None and message_bytes[:4] == _ZSTD_MAGIC:
+            return self._zstd_decompressor.decompress(message_bytes)
+        if message_bytes[:2] == _GZIP_MAGIC:
+            decompressed_bytes = gzip.decompress(message_bytes)
+            if self.logger.is_enabled_for(logging.DEBUG):
+                self.logger.debug("Message decompressed", 
+                                compressed_size=len(message_bytes),
+                                decompressed_size=len(decompressed_bytes))
+            return decompressed_bytes
+        return message_bytes
 
 
 class A2AMessageConverter:
@@ -190,6 +322,19 @@ class A2AMessageConverter:
         self.logger = structlog.get_logger(__name__).bind(
             component="message_converter"
         )
+        
+        # Converters looked up by exact message type
+        self._a2a_converters = {
+            A2ARequest: self._convert_request,
+            A2AResponse: self._convert_response,
+            A2AError: self._convert_error,
+        }
+        self._jsonrpc_converters = {
+            JSONRPCRequest: self._convert_from_request,
+            JSONRPCResponse: self._convert_from_response,
+            JSONRPCErrorResponse: self._convert_from_error_response,
+            JSONRPCNotification: self._convert_from_notification,
+        }
     
     def a2a_to_envelope(self, a2a_message: A2AMessage) -> A2AMessageEnvelope:
         """
@@ -202,14 +347,14 @@ class A2AMessageConverter:
             JSON-RPC envelope containing the converted message
         """
         try:
-            if isinstance(a2a_message, A2ARequest):
-                return self._convert_request(a2a_message)
-            elif isinstance(a2a_message, A2AResponse):
-                return self._convert_response(a2a_message)
-            elif isinstance(a2a_message, A2AError):
-                return self._convert_error(a2a_message)
-            else:
-                return self._convert_generic_message(a2a_message)
+            converter = self._a2a_converters.get(type(a2a_message))
+            if converter is None:
+                # Subclasses miss the exact-type lookup
+                converter = next(
+                    (fn for cls, fn in self._a2a_converters.items() if isinstance(a2a_message, cls)),
+                    self._convert_generic_message
+                )
+            return converter(a2a_message)
                 
         except Exception as e:
             self.logger.error("A2A to envelope conversion failed", error=str(e))
@@ -228,16 +373,15 @@ class A2AMessageConverter:
         try:
             jsonrpc_msg = envelope.jsonrpc_message
             
-            if isinstance(jsonrpc_msg, JSONRPCRequest):
-                return self._convert_from_request(envelope, jsonrpc_msg)
-            elif isinstance(jsonrpc_msg, JSONRPCResponse):
-                return self._convert_from_response(envelope, jsonrpc_msg)
-            elif isinstance(jsonrpc_msg, JSONRPCErrorResponse):
-                return self._convert_from_error_response(envelope, jsonrpc_msg)
-            elif isinstance(jsonrpc_msg, JSONRPCNotification):
-                return self._convert_from_notification(envelope, jsonrpc_msg)
-            else:
+            converter = self._jsonrpc_converters.get(type(jsonrpc_msg))
+            if converter is None:
+                converter = next(
+                    (fn for cls, fn in self._jsonrpc_converters.items() if isinstance(jsonrpc_msg, cls)),
+                    None
+                )
+            if converter is None:
                 raise ValueError(f"Unsupported JSON-RPC message type: {type(jsonrpc_msg)}")
+            return converter(envelope, jsonrpc_msg)
                 
         except Exception as e:
             self.logger.error("Envelope to A2A conversion failed", error=str(e))
@@ -277,15 +421,7 @@ class A2AMessageConverter:
     
     def _convert_error(self, a2a_error: A2AError) -> A2AMessageEnvelope:
         """Convert A2A error to JSON-RPC envelope"""
-        # Map A2A error codes to JSON-RPC error codes
-        error_code_mapping = {
-            "AGENT_NOT_FOUND": JSONRPCErrorCode.AGENT_NOT_FOUND,
-            "CAPABILITY_NOT_FOUND": JSONRPCErrorCode.CAPABILITY_NOT_FOUND,
-            "TIMEOUT": JSONRPCErrorCode.TIMEOUT_ERROR,
-            "VALIDATION_ERROR": JSONRPCErrorCode.VALIDATION_ERROR,
-        }
-        
-        error_code = error_code_mapping.get(
+        error_code = _ERROR_CODE_MAP.get(
             a2a_error.error_code, 
             JSONRPCErrorCode.INTERNAL_ERROR
         )
@@ -302,10 +438,7 @@ class A2AMessageConverter:
     
     def _convert_generic_message(self, a2a_message: A2AMessage) -> A2AMessageEnvelope:
         """Convert generic A2A message to JSON-RPC notification"""
-        method = {
-            MessageType.HEARTBEAT: A2AMethod.HEARTBEAT,
-            MessageType.NOTIFICATION: "a2a.notify.generic"
-        }.get(a2a_message.message_type, "a2a.notify.generic")
+        method = _NOTIFICATION_METHOD_MAP.get(a2a_message.message_type, "a2a.notify.generic")
         
         return create_notification(
             sender_id=a2a_message.sender_id,
@@ -320,6 +453,10 @@ class A2AMessageConverter:
         params = request.params or {}
         if isinstance(params, dict):
             capability = params.get('capability_name', 'unknown')
+            # The small set of capability names recurs on every request; params
+            # are untyped, so the JSON decoder's string cache does not cover them
+            if isinstance(capability, str):
+                capability = sys.intern(capability)
             parameters = params.get('parameters', {})
         else:
             capability = 'unknown'
@@ -382,16 +519,27 @@ class A2AMessageConverter:
         )
 
 
+# Shared instances; they hold only configuration and reusable codec contexts
+_default_serializer = A2AMessageSerializer()
+_default_converter = A2AMessageConverter()
+
+
 class MessageRouter:
     """
     Routes messages between agents and handles message delivery.
     """
     
-    def __init__(self):
-        self.serializer = A2AMessageSerializer()
-        self.converter = A2AMessageConverter()
+    def __init__(self, compression_level: int = 1):
+        # Routers share the stateless default serializer and converter unless
+        # they need a different compression level
+        if compression_level == _default_serializer.compression_level:
+            self.serializer = _default_serializer
+        else:
+            self.serializer = A2AMessageSerializer(compression_level=compression_level)
+        self.converter = _default_converter
         self.message_handlers = {}
-        self.pending_requests = {}  # For tracking request-response correlation
+        # For tracking request-response correlation, keyed by (agent_id, request_id)
+        self.pending_requests: Dict[tuple, asyncio.Future] = {}
         
         self.logger = structlog.get_logger(__name__).bind(
             component="message_router"
@@ -431,8 +579,8 @@ class MessageRouter:
             Response envelope if this is a request expecting a response
         """
         try:
-            # Serialize message
-            message_bytes = self.serializer.serialize_message(envelope)
+            # Serialize message; large payloads are compressed off the event loop
+            message_bytes = await self.serializer.serialize_message_async(envelope)
             
             # Send through transport
             await transport_send_func(message_bytes)
@@ -440,16 +588,17 @@ class MessageRouter:
             # If this is a request, track it for response correlation
             if isinstance(envelope.jsonrpc_message, JSONRPCRequest):
                 request_id = envelope.jsonrpc_message.id
-                correlation_key = f"{envelope.sender_id}:{request_id}"
+                correlation_key = (envelope.sender_id, request_id)
                 
                 # Create future for response
-                response_future = asyncio.Future()
+                response_future = asyncio.get_running_loop().create_future()
                 self.pending_requests[correlation_key] = response_future
                 
                 try:
-                    # Wait for response with timeout
-                    response = await asyncio.wait_for(response_future, timeout=envelope.ttl)
-                    return response
+                    # Wait for response with timeout; asyncio.timeout awaits the
+                    # future directly instead of wrapping it like wait_for does
+                    async with asyncio.timeout(envelope.ttl):
+                        return await response_future
                 except asyncio.TimeoutError:
                     self.logger.warning("Request timeout", 
                                       envelope_id=envelope.envelope_id,
@@ -477,30 +626,202 @@ class MessageRouter:
         try:
             # Deserialize message
             envelope = self.serializer.deserialize_message(message_bytes)
-            
-            # Check if this is a response to a pending request
-            if isinstance(envelope.jsonrpc_message, (JSONRPCResponse, JSONRPCErrorResponse)):
-                request_id = envelope.jsonrpc_message.id
-                correlation_key = f"{envelope.recipient_id}:{request_id}"
-                
-                if correlation_key in self.pending_requests:
-                    # Complete the pending request
-                    future = self.pending_requests[correlation_key]
-                    if not future.done():
-                        future.set_result(envelope)
-                    return
-            
-            # Route to handler
-            handler = self.message_handlers.get(envelope.recipient_id)
-            if handler:
-                await handler(envelope)
-            else:
-                self.logger.warning("No handler found for recipient", 
-                                  recipient_id=envelope.recipient_id)
+            await self._deliver(envelope)
                 
         except Exception as e:
             self.logger.error("Message receive failed", error=str(e))
             # TODO: Send error response if possible
+    
+    async def send_many(self, envelopes: List[A2AMessageEnvelope], transport_send_func):
+        """
+        Send several envelopes as a single batch through the transport layer.
+        
+        The batch is serialized and compressed once and sent in one call.
+        Responses to requests in the batch are not awaited; use send_message
+        for request-response exchanges.
+        
+        Args:
+            envelopes: Message envelopes to send
+            transport_send_func: Function to send serialized message bytes
+        """
+        if not envelopes:
+            return
+        try:
+            await transport_send_func(self.serializer.serialize_batch(envelopes))
+        except Exception as e:
+            self.logger.error("Message batch send failed", count=len(envelopes), error=str(e))
+            raise
+    
+    async def receive_many(self, message_bytes: bytes):
+        """
+        Receive and process a batch sent with send_many.
+        
+        Args:
+            message_bytes: Serialized batch bytes
+        """
+        try:
+            envelopes = self.serializer.deserialize_batch(message_bytes)
+        except Exception as e:
+            self.logger.error("Message batch receive failed", error=str(e))
+            return
+        
+        for envelope in envelopes:
+            try:
+                await self._deliver(envelope)
+            except Exception as e:
+                self.logger.error("Message receive failed", 
+                                envelope_id=envelope.envelope_id,
+                                error=str(e))
+    
+    async def _deliver(self, envelope: A2AMessageEnvelope):
+        """Resolve a pending request or route the envelope to its handler"""
+        # Check if this is a response to a pending request
+        if isinstance(envelope.jsonrpc_message, (JSONRPCResponse, JSONRPCErrorResponse)):
+            request_id = envelope.jsonrpc_message.id
+            # Complete the pending request with a single lookup
+            future = self.pending_requests.pop((envelope.recipient_id, request_id), None)
+            if future is not None:
+                if not future.done():
+                    future.set_result(envelope)
+                return
+        
+        # Route to handler
+        handler = self.message_handlers.get(envelope.recipient_id)
+        if handler:
+            await handler(envelope)
+        else:
+            self.logger.warning("No handler found for recipient", 
+                              recipient_id=envelope.recipient_id)
+
+
+class MessageBatcher:
+    """
+    Coalesces outgoing envelopes per transport into windowed batches.
+    
+    Envelopes for the same transport function are buffered until either
+    max_batch of them are pending or max_wait seconds have passed since the
+    first one, then sent together with MessageRouter.send_many. A lone
+    envelope at the deadline is sent on its own with send_message.
+    
+    Each transport has its own chain of flushes: batches for one transport
+    are sent strictly in order, while a slow transport does not hold up the
+    others.
+    """
+    
+    def __init__(self, router: MessageRouter, max_batch: int = 50, max_wait: float = 2.0,
+                 max_pending: int = 10_000):
+        """
+        Initialize the message batcher.
+        
+        Args:
+            router: Router used to send the batches
+            max_batch: Number of pending envelopes that triggers an immediate flush
+            max_wait: Maximum time in seconds an envelope waits for its batch
+            max_pending: Queued envelopes beyond which enqueue waits for the worker
+        """
+        self.router = router
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        # Bounded so a burst of senders is slowed down instead of growing memory
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+        self._worker: Optional[asyncio.Task] = None
+        # Most recently scheduled flush per transport; each flush waits for its predecessor
+        self._flush_tails: Dict[Any, asyncio.Task] = {}
+        
+        self.logger = structlog.get_logger(__name__).bind(
+            component="message_batcher"
+        )
+    
+    def start(self):
+        """Start the background flush worker"""
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+    
+    async def stop(self):
+        """Flush everything still pending and stop the worker"""
+        if self._worker is None:
+            return
+        await self._queue.put(None)
+        await self._worker
+        self._worker = None
+        if self._flush_tails:
+            await asyncio.wait(list(self._flush_tails.values()))
+    
+    async def enqueue(self, envelope: A2AMessageEnvelope, transport_send_func):
+        """
+        Queue an envelope for batched delivery, waiting while the queue is full.
+        
+        Args:
+            envelope: Message envelope to send; requests are not accepted since
+                their responses must be awaited individually
+            transport_send_func: Function to send serialized message bytes
+        """
+        if isinstance(envelope.jsonrpc_message, JSONRPCRequest):
+            raise ValueError("Requests cannot be batched; use MessageRouter.send_message")
+        await self._queue.put((envelope, transport_send_func))
+    
+    async def _run(self):
+        """Collect envelopes into per-transport buckets and flush them"""
+        loop = asyncio.get_running_loop()
+        buckets: Dict[Any, List[A2AMessageEnvelope]] = {}
+        deadline: Optional[float] = None
+        stopping = False
+        
+        while not stopping:
+            timeout = None if deadline is None else max(0.0, deadline - loop.time())
+            try:
+                item = await asyncio.wait_for(self._queue.get(), timeout=timeout)
+            except asyncio.TimeoutError:
+                item = ()
+            
+            if item is None:
+                stopping = True
+            elif item:
+                envelope, transport_send_func = item
+                bucket = buckets.setdefault(transport_send_func, [])
+                bucket.append(envelope)
+                if deadline is None:
+                    deadline = loop.time() + self.max_wait
+                if len(bucket) >= self.max_batch:
+                    self._schedule_flush(transport_send_func, buckets.pop(transport_send_func))
+                    if not buckets:
+                        deadline = None
+                    continue
+            
+            if stopping or (deadline is not None and loop.time() >= deadline):
+                for transport_send_func, envelopes in buckets.items():
+                    self._schedule_flush(transport_send_func, envelopes)
+                buckets.clear()
+                deadline = None
+    
+    def _schedule_flush(self, transport_send_func, envelopes: List[A2AMessageEnvelope]):
+        """Start a flush that runs once the transport's previous flush has finished"""
+        previous = self._flush_tails.get(transport_send_func)
+        task = asyncio.create_task(self._flush_after(previous, transport_send_func, envelopes))
+        self._flush_tails[transport_send_func] = task
+        task.add_done_callback(lambda done: self._forget_flush(transport_send_func, done))
+    
+    def _forget_flush(self, transport_send_func, task: asyncio.Task):
+        """Drop a finished flush unless a newer one was chained after it"""
+        if self._flush_tails.get(transport_send_func) is task:
+            del self._flush_tails[transport_send_func]
+    
+    async def _flush_after(self, previous: Optional[asyncio.Task], transport_send_func,
+                           envelopes: List[A2AMessageEnvelope]):
+        """Wait for the previous flush of this transport, then send the bucket"""
+        if previous is not None:
+            await asyncio.wait((previous,))
+        await self._flush(transport_send_func, envelopes)
+    
+    async def _flush(self, transport_send_func, envelopes: List[A2AMessageEnvelope]):
+        """Send one bucket, logging rather than raising so the worker survives"""
+        try:
+            if len(envelopes) == 1:
+                await self.router.send_message(envelopes[0], transport_send_func)
+            else:
+                await self.router.send_many(envelopes, transport_send_func)
+        except Exception as e:
+            self.logger.error("Batched send failed", count=len(envelopes), error=str(e))
 
 
 # Global message router instance
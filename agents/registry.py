@@ -8,6 +8,7 @@ discover each other and their capabilities through a centralized directory.
 import asyncio
 import time
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Set
 from uuid import uuid4
@@ -36,8 +37,9 @@ class RegistryQuery(BaseModel):
     max_results: int = 10
 
 
-class RegistryEntry(BaseModel):
-    """Registry entry for an agent"""
+@dataclass(slots=True)
+class RegistryEntry:
+    """Registry entry for an agent (internal, so a slotted dataclass rather than a model)"""
     agent_card: AgentCard
     registered_at: datetime
     last_heartbeat: datetime
@@ -105,8 +107,11 @@ class InMemoryAgentRegistry(AgentRegistryInterface):
             cleanup_interval: How often to run cleanup (seconds)
         """
         self._agents: Dict[str, RegistryEntry] = {}
-        self._capabilities: Dict[str, Set[str]] = {}  # capability_name -> agent_ids
-        self._capability_types: Dict[CapabilityType, Set[str]] = {}  # type -> agent_ids
+        # Indexes hold the entries themselves so lookups skip a second probe of _agents
+        self._capabilities: Dict[str, Dict[str, RegistryEntry]] = {}  # capability_name -> agent_id -> entry
+        self._capability_types: Dict[CapabilityType, Dict[str, RegistryEntry]] = {}  # type -> agent_id -> entry
+        self._statuses: Dict[AgentStatus, Dict[str, RegistryEntry]] = {}  # status -> agent_id -> entry
+        self._online_count = 0  # kept in step with RegistryEntry.is_online transitions
         self._cleanup_interval = cleanup_interval
         self._cleanup_task: Optional[asyncio.Task] = None
         self._running = False
@@ -154,11 +159,21 @@ class InMemoryAgentRegistry(AgentRegistryInterface):
                 is_online=True
             )
             
+            # Drop index entries of a previous registration under the same ID
+            previous = self._agents.get(agent_card.agent_id)
+            if previous is not None:
+                await self._unindex_agent_capabilities(previous.agent_card)
+                await self._unindex_agent_status(previous.agent_card)
+                if previous.is_online:
+                    self._online_count -= 1
+            
             # Store agent
             self._agents[agent_card.agent_id] = entry
+            self._online_count += 1
             
-            # Index capabilities
-            await self._index_agent_capabilities(agent_card)
+            # Index capabilities and status
+            await self._index_agent_capabilities(entry)
+            await self._index_agent_status(entry)
             
             self.logger.info(
                 "Agent registered",
@@ -186,11 +201,14 @@ class InMemoryAgentRegistry(AgentRegistryInterface):
             
             entry = self._agents[agent_id]
             
-            # Remove from capability indexes
+            # Remove from capability and status indexes
             await self._unindex_agent_capabilities(entry.agent_card)
+            await self._unindex_agent_status(entry.agent_card)
             
             # Remove agent
             del self._agents[agent_id]
+            if entry.is_online:
+                self._online_count -= 1
             
             self.logger.info("Agent unregistered", agent_id=agent_id)
             return True
@@ -212,15 +230,17 @@ class InMemoryAgentRegistry(AgentRegistryInterface):
             
             entry = self._agents[agent_card.agent_id]
             
-            # Remove old capability indexes
+            # Remove old capability and status indexes
             await self._unindex_agent_capabilities(entry.agent_card)
+            await self._unindex_agent_status(entry.agent_card)
             
             # Update entry
             entry.agent_card = agent_card
             entry.last_heartbeat = datetime.utcnow()
             
-            # Re-index capabilities
-            await self._index_agent_capabilities(agent_card)
+            # Re-index capabilities and status
+            await self._index_agent_capabilities(entry)
+            await self._index_agent_status(entry)
             
             self.logger.debug("Agent updated", agent_id=agent_card.agent_id)
             return True
@@ -242,11 +262,15 @@ class InMemoryAgentRegistry(AgentRegistryInterface):
             
             entry = self._agents[agent_id]
             entry.last_heartbeat = datetime.utcnow()
-            entry.is_online = True
+            if not entry.is_online:
+                entry.is_online = True
+                self._online_count += 1
             
             # Update agent status if it was offline
             if entry.agent_card.status == AgentStatus.OFFLINE:
+                await self._unindex_agent_status(entry.agent_card)
                 entry.agent_card.status = AgentStatus.READY
+                await self._index_agent_status(entry)
             
             self.logger.debug("Heartbeat recorded", agent_id=agent_id)
             return True
@@ -264,7 +288,25 @@ class InMemoryAgentRegistry(AgentRegistryInterface):
         try:
             matching_agents = []
             
-            for agent_id, entry in self._agents.items():
+            if query.capability_name or query.capability_type:
+                by_name = self._capabilities.get(query.capability_name) if query.capability_name else None
+                by_type = self._capability_types.get(query.capability_type) if query.capability_type else None
+                if not by_name and not by_type:
+                    # Nothing is indexed under the queried capability
+                    return matching_agents
+                
+                # Only agents in the capability indexes can match; walk them in
+                # registration order so max_results keeps the earliest ones
+                candidate_entries = {**(by_name or {}), **(by_type or {})}
+                candidates = sorted(candidate_entries.items(), key=lambda item: item[1].registered_at)
+            elif query.agent_status:
+                # Only agents currently in the requested status can match
+                by_status = self._statuses.get(query.agent_status, {})
+                candidates = sorted(by_status.items(), key=lambda item: item[1].registered_at)
+            else:
+                candidates = self._agents.items()
+            
+            for agent_id, entry in candidates:
                 # Skip excluded agents
                 if agent_id in query.exclude_agents:
                     continue
@@ -277,11 +319,6 @@ class InMemoryAgentRegistry(AgentRegistryInterface):
                 if query.agent_status and entry.agent_card.status != query.agent_status:
                     continue
                 
-                # Check capabilities
-                if query.capability_name or query.capability_type:
-                    if not self._agent_matches_capability_query(entry.agent_card, query):
-                        continue
-                
                 matching_agents.append(entry.agent_card)
                 
                 # Limit results
@@ -311,7 +348,13 @@ class InMemoryAgentRegistry(AgentRegistryInterface):
         capabilities = []
         seen_capabilities = set()
         
-        for entry in self._agents.values():
+        # With a type filter only agents indexed under that type can contribute
+        if capability_type:
+            entries = self._capability_types.get(capability_type, {}).values()
+        else:
+            entries = self._agents.values()
+        
+        for entry in entries:
             for capability in entry.agent_card.capabilities:
                 # Skip duplicates
                 if capability.name in seen_capabilities:
@@ -328,32 +371,25 @@ class InMemoryAgentRegistry(AgentRegistryInterface):
     
     async def find_agents_with_capability(self, capability_name: str) -> List[AgentCard]:
         """Find all agents that provide a specific capability"""
-        agent_ids = self._capabilities.get(capability_name, set())
-        agents = []
-        
-        for agent_id in agent_ids:
-            entry = self._agents.get(agent_id)
-            if entry and entry.is_online:
-                agents.append(entry.agent_card)
-        
-        return agents
+        entries = self._capabilities.get(capability_name, {})
+        return [entry.agent_card for entry in entries.values() if entry.is_online]
     
     # Private methods
     
-    async def _index_agent_capabilities(self, agent_card: AgentCard) -> None:
+    async def _index_agent_capabilities(self, entry: RegistryEntry) -> None:
         """Add agent to capability indexes"""
-        agent_id = agent_card.agent_id
+        agent_id = entry.agent_card.agent_id
         
-        for capability in agent_card.capabilities:
+        for capability in entry.agent_card.capabilities:
             # Index by capability name
             if capability.name not in self._capabilities:
-                self._capabilities[capability.name] = set()
-            self._capabilities[capability.name].add(agent_id)
+                self._capabilities[capability.name] = {}
+            self._capabilities[capability.name][agent_id] = entry
             
             # Index by capability type
             if capability.capability_type not in self._capability_types:
-                self._capability_types[capability.capability_type] = set()
-            self._capability_types[capability.capability_type].add(agent_id)
+                self._capability_types[capability.capability_type] = {}
+            self._capability_types[capability.capability_type][agent_id] = entry
     
     async def _unindex_agent_capabilities(self, agent_card: AgentCard) -> None:
         """Remove agent from capability indexes"""
@@ -362,28 +398,29 @@ class InMemoryAgentRegistry(AgentRegistryInterface):
         for capability in agent_card.capabilities:
             # Remove from capability name index
             if capability.name in self._capabilities:
-                self._capabilities[capability.name].discard(agent_id)
+                self._capabilities[capability.name].pop(agent_id, None)
                 if not self._capabilities[capability.name]:
                     del self._capabilities[capability.name]
             
             # Remove from capability type index
             if capability.capability_type in self._capability_types:
-                self._capability_types[capability.capability_type].discard(agent_id)
+                self._capability_types[capability.capability_type].pop(agent_id, None)
                 if not self._capability_types[capability.capability_type]:
                     del self._capability_types[capability.capability_type]
     
-    def _agent_matches_capability_query(self, agent_card: AgentCard, query: RegistryQuery) -> bool:
-        """Check if agent matches capability query criteria"""
-        for capability in agent_card.capabilities:
-            # Check capability name
-            if query.capability_name and capability.name == query.capability_name:
-                return True
-            
-            # Check capability type
-            if query.capability_type and capability.capability_type == query.capability_type:
-                return True
-        
-        return False
+    async def _index_agent_status(self, entry: RegistryEntry) -> None:
+        """Add agent to the status index"""
+        status = entry.agent_card.status
+        if status not in self._statuses:
+            self._statuses[status] = {}
+        self._statuses[status][entry.agent_card.agent_id] = entry
+    
+    async def _unindex_agent_status(self, agent_card: AgentCard) -> None:
+        """Remove agent from the status index"""
+        if agent_card.status in self._statuses:
+            self._statuses[agent_card.status].pop(agent_card.agent_id, None)
+            if not self._statuses[agent_card.status]:
+                del self._statuses[agent_card.status]
     
     async def _cleanup_loop(self) -> None:
         """Background task to clean up stale agents"""
@@ -408,8 +445,13 @@ class InMemoryAgentRegistry(AgentRegistryInterface):
             
             if now - entry.last_heartbeat > timeout:
                 stale_agents.append(agent_id)
-                entry.is_online = False
-                entry.agent_card.status = AgentStatus.OFFLINE
+                if entry.is_online:
+                    entry.is_online = False
+                    self._online_count -= 1
+                if entry.agent_card.status != AgentStatus.OFFLINE:
+                    await self._unindex_agent_status(entry.agent_card)
+                    entry.agent_card.status = AgentStatus.OFFLINE
+                    await self._index_agent_status(entry)
         
         if stale_agents:
             self.logger.info(
@@ -422,7 +464,7 @@ class InMemoryAgentRegistry(AgentRegistryInterface):
     
     async def get_stats(self) -> Dict[str, any]:
         """Get registry statistics"""
-        online_agents = sum(1 for entry in self._agents.values() if entry.is_online)
+        online_agents = self._online_count
         offline_agents = len(self._agents) - online_agents
         
         return {
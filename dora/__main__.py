@@ -6,15 +6,16 @@ import json
 import logging
 import os
 import sys
-from datetime import datetime
-from typing import Dict, List, Optional
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from agents import Agent, ModelSettings, Runner, trace, function_tool, set_default_openai_key, WebSearchTool
 from openai import AsyncOpenAI
 from pydantic import BaseModel, Field
+import orjson
 import time
 
-from dora.models.config import DoraConfig
+from dora.models.config import AgentConfig, DoraConfig
 from dora.trace_processor import DebugTraceProcessor
 from dora.models.event import (
     AudienceDemographic,
@@ -33,15 +34,16 @@ from dora.tools import (
     NotificationData,
     AudienceData,
 )
-from dora.memory_cache import MemoryCache
+from dora.logging_config import configure_logging
+from dora.memory_cache import MemoryCache, SearchResultCache
 
-# Configure logging
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
+# Log level for configure_logging in main()
 log_level = os.getenv("LOG_LEVEL", "INFO").upper()
-logging.basicConfig(
-    level=getattr(logging, log_level, logging.INFO),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[logging.StreamHandler()],
-)
 
 # Reduce verbosity for third-party libraries to avoid request body logging
 logging.getLogger("openai_agents").setLevel(logging.WARNING)
@@ -335,11 +337,12 @@ def create_orchestrator_agent(config: DoraConfig, events_count: int = 10) -> Age
     )
 
 
-def format_notification_for_display(notification: FinalResult) -> Dict:
+def format_notification_for_display(notification: FinalResult, today: Optional[date] = None) -> Dict:
     """Format a notification for display.
     
     Args:
         notification: The event notification to format
+        today: Current date, computed once by callers formatting many events
         
     Returns:
         A dictionary with formatted event notification data
@@ -350,14 +353,15 @@ def format_notification_for_display(notification: FinalResult) -> Dict:
     
     # Format dates and check they are not in the past
     start_date = event.start_date
-    current_date = datetime.now()
+    if today is None:
+        today = date.today()
     is_future_event = True
     
     if isinstance(start_date, str):
         try:
             date_obj = datetime.fromisoformat(start_date.replace('Z', '+00:00'))
             # Check if the event is in the past (before today)
-            is_future_event = date_obj.date() >= current_date.date()
+            is_future_event = date_obj.date() >= today
             start_date = date_obj.strftime("%Y-%m-%d %H:%M")
         except (ValueError, TypeError):
             pass
@@ -526,8 +530,115 @@ async def process_city_original(city: str, days_ahead: int = 14, events_count: i
     return result.final_output.results
 
 
-async def process_city(city: str, days_ahead: int = 14, events_count: int = 10, config: Optional[DoraConfig] = None):
-    """Process a city to find events and generate notifications with caching.
+# Notification context shared by every text writer request
+NOTIFICATION_CONTEXT = {
+    "group_id": "general",
+    "season": "winter",
+    "time_of_day": "evening"
+}
+
+async def map_ordered(
+    func: Callable[[Any], Awaitable[Any]], items: List[Any], concurrency: int
+) -> AsyncIterator[Any]:
+    """Run a coroutine function over items with a fixed pool of workers.
+    
+    Each worker takes the next item as soon as it finishes the previous one,
+    so there is no waiting for a whole wave to complete. Results are yielded
+    in input order as they become available.
+    
+    Args:
+        func: Coroutine function applied to each item
+        items: Items to process
+        concurrency: Number of workers
+        
+    Yields:
+        The result for each item, in input order
+        
+    Raises:
+        BaseException: The first exception raised by func, in input order
+    """
+    loop = asyncio.get_running_loop()
+    pending: asyncio.Queue = asyncio.Queue()
+    for index, item in enumerate(items):
+        pending.put_nowait((index, item))
+    futures = [loop.create_future() for _ in items]
+    
+    async def worker() -> None:
+        while not pending.empty():
+            index, item = pending.get_nowait()
+            future = futures[index]
+            try:
+                result = await func(item)
+            except BaseException as e:
+                # Resolve the slot even on cancellation so the consumer never
+                # waits on it forever, then let cancellation end the worker
+                if not future.done():
+                    future.set_exception(e)
+                if not isinstance(e, Exception):
+                    raise
+            else:
+                if not future.done():
+                    future.set_result(result)
+    
+    workers = [asyncio.create_task(worker()) for _ in range(min(concurrency, len(items)))]
+    try:
+        for future in futures:
+            yield await future
+    finally:
+        for task in workers:
+            task.cancel()
+        # Results nobody will consume: drop pending ones and mark failures as
+        # retrieved so they are not reported as never retrieved
+        for future in futures:
+            if not future.done():
+                future.cancel()
+            elif not future.cancelled():
+                future.exception()
+
+
+# Agents are stateless, so each distinct configuration is built only once
+_agent_cache: Dict[tuple, Agent] = {}
+
+
+def get_agent(name: str, agent_config: AgentConfig, factory: Callable[[], Agent], *variant: Any) -> Agent:
+    """Get a cached agent, building it with factory on first use.
+    
+    Args:
+        name: Agent role name
+        agent_config: Configuration the agent is built from
+        factory: Builds the agent on a cache miss
+        variant: Extra values the agent's instructions depend on
+        
+    Returns:
+        The shared agent for this configuration
+    """
+    key = (name, agent_config.model, agent_config.temperature, *variant)
+    agent = _agent_cache.get(key)
+    if agent is None:
+        agent = _agent_cache[key] = factory()
+    return agent
+
+
+# City search results shared across requests, created on first use
+_search_cache: Optional[SearchResultCache] = None
+
+
+def get_search_cache(config: DoraConfig) -> SearchResultCache:
+    """Get the shared city search cache."""
+    global _search_cache
+    if _search_cache is None:
+        _search_cache = SearchResultCache(
+            max_size=config.search_cache_max_size,
+            ttl_seconds=config.search_cache_ttl_seconds,
+            empty_ttl_seconds=config.search_cache_empty_ttl_seconds,
+        )
+    return _search_cache
+
+
+async def iter_city_results(
+    city: str, days_ahead: int = 14, events_count: int = 10, config: Optional[DoraConfig] = None
+) -> AsyncIterator[FinalResult]:
+    """Process a city and yield each event result as soon as it is ready.
     
     Args:
         city: The city to process
@@ -535,8 +646,8 @@ async def process_city(city: str, days_ahead: int = 14, events_count: int = 10,
         events_count: Number of events to find and process
         config: Application configuration
         
-    Returns:
-        Processed results
+    Yields:
+        Processed result for a single event
     """
     if config is None:
         config = DoraConfig()
@@ -547,11 +658,19 @@ async def process_city(city: str, days_ahead: int = 14, events_count: int = 10,
     # Set up OpenAI client
     set_default_openai_key(config.openai_api_key)
     
-    # Create agents
-    event_finder = create_event_finder_agent(config, events_count)
-    event_classifier = create_event_classifier_agent(config)
-    language_selector = create_language_selector_agent(config)
-    text_writer = create_text_writer_agent(config)
+    # Get agents, reusing ones already built for this configuration
+    event_finder = get_agent(
+        "event_finder", config.event_finder_config, lambda: create_event_finder_agent(config, events_count), events_count
+    )
+    event_classifier = get_agent(
+        "event_classifier", config.event_classifier_config, lambda: create_event_classifier_agent(config)
+    )
+    language_selector = get_agent(
+        "language_selector", config.language_selector_config, lambda: create_language_selector_agent(config)
+    )
+    text_writer = get_agent(
+        "text_writer", config.text_writer_config, lambda: create_text_writer_agent(config)
+    )
     
     # Track timing
     total_start_time = time.time()
@@ -561,36 +680,31 @@ async def process_city(city: str, days_ahead: int = 14, events_count: int = 10,
     with trace(f"ProcessCity:{city}") as process_trace:
         process_trace.metadata = {"city": city, "days_ahead": str(days_ahead), "events_count": str(events_count)}
         
-        # Step 1: Find events
-        logger.info(f"Finding events in {city}")
-        find_events_start = time.time()
-        
-        event_result = await Runner.run(
-            event_finder,
-            city
-        )
+        # Steps 1 and 2 are independent: find events and get languages for the city concurrently
+        logger.info(f"Finding events and languages in {city}")
+        search_start = time.time()
         
-        find_events_duration = time.time() - find_events_start
-        events = event_result.final_output.events if event_result.final_output else []
-        logger.info(f"Found {len(events)} events in {find_events_duration:.2f}s")
-        
-        # Step 2: Get languages for the city
-        logger.info(f"Getting languages for {city}")
-        lang_start = time.time()
+        async def search_city():
+            event_result, language_result = await asyncio.gather(
+                Runner.run(event_finder, city),
+                Runner.run(language_selector, city),
+            )
+            events = event_result.final_output.events if event_result.final_output else []
+            languages = language_result.final_output.languages if language_result.final_output else ["en"]
+            return events, languages
         
-        language_result = await Runner.run(
-            language_selector,
-            city
+        # Repeated searches for the same city are served from the shared cache;
+        # searches that found nothing expire quickly so a transient miss is retried
+        search_key = (city.strip().lower(), days_ahead, events_count)
+        events, languages = await get_search_cache(config).get_or_compute(
+            search_key, search_city, is_empty=lambda result: not result[0]
         )
         
-        languages = language_result.final_output.languages if language_result.final_output else ["en"]
-        lang_duration = time.time() - lang_start
-        logger.info(f"Found languages {languages} in {lang_duration:.2f}s")
+        search_duration = time.time() - search_start
+        logger.info(f"Found {len(events)} events and languages {languages} in {search_duration:.2f}s")
         
         # Step 3: Process each event with caching
-        results = []
-        
-        for i, event in enumerate(events):
+        async def process_event(i: int, event: EventData) -> Tuple[FinalResult, bool, int]:
             logger.info(f"Processing event {i+1}/{len(events)}: {event.name}")
             event_start = time.time()
             
@@ -603,27 +717,20 @@ async def process_city(city: str, days_ahead: int = 14, events_count: int = 10,
             if cached_data:
                 # Use cached data
                 logger.info(f"Cache hit for event: {event.name}")
-                cache_hits += 1
-                
                 result = FinalResult(
                     event=event,
                     classification=EventClassification(**cached_data["classification"]),
                     notifications=[NotificationData(**n) for n in cached_data["notifications"]]
                 )
-                results.append(result)
-                process_trace.metadata[f"event_{i}_cached"] = "true"
-                continue
-            
-            # Process event if not in cache
-            cache_misses += 1
+                return result, True, 0
             
-            # Classify the event
+            # Not cached: classify the event
             logger.info(f"Classifying event: {event.name}")
             classify_start = time.time()
             
             classification_result = await Runner.run(
                 event_classifier,
-                json.dumps(event_dict)
+                orjson.dumps(event_dict).decode()
             )
             classification = classification_result.final_output.classification
             classify_duration = time.time() - classify_start
@@ -633,38 +740,43 @@ async def process_city(city: str, days_ahead: int = 14, events_count: int = 10,
             notifications = []
             notify_start = time.time()
             
-            for language in languages:
-                for audience in classification.target_audiences:
-                    notification_input = {
-                        "event": event_dict,
-                        "audience": {
-                            "demographic": audience.model_dump() if hasattr(audience, 'model_dump') else audience,
-                            "interests": [],
-                            "tech_savvy": True,
-                            "local": True
-                        },
-                        "language": language,
-                        "context": {
-                            "group_id": "general",
-                            "season": "winter",
-                            "time_of_day": "evening"
-                        }
-                    }
-                    
-                    notification_result = await Runner.run(
-                        text_writer,
-                        json.dumps(notification_input)
-                    )
-                    
-                    if notification_result.final_output and notification_result.final_output.notifications:
-                        for notif in notification_result.final_output.notifications:
-                            # Add language and group info to notification
-                            notif_dict = notif.model_dump()
-                            notif_dict["language"] = language
-                            if "context" not in notif_dict:
-                                notif_dict["context"] = {}
-                            notif_dict["context"]["group_id"] = "general"
-                            notifications.append(NotificationData(**notif_dict))
+            # Audience payloads depend only on the classification, so build them once
+            audience_payloads = [
+                {
+                    "demographic": audience.model_dump() if hasattr(audience, 'model_dump') else audience,
+                    "interests": [],
+                    "tech_savvy": True,
+                    "local": True
+                }
+                for audience in classification.target_audiences
+            ]
+            notification_inputs = [
+                (language, {
+                    "event": event_dict,
+                    "audience": audience_payload,
+                    "language": language,
+                    "context": NOTIFICATION_CONTEXT
+                })
+                for language in languages
+                for audience_payload in audience_payloads
+            ]
+            
+            # Write all language/audience variants concurrently; results keep input order
+            notification_results = await asyncio.gather(*(
+                Runner.run(text_writer, orjson.dumps(notification_input).decode())
+                for _, notification_input in notification_inputs
+            ))
+            
+            for (language, _), notification_result in zip(notification_inputs, notification_results):
+                if notification_result.final_output and notification_result.final_output.notifications:
+                    for notif in notification_result.final_output.notifications:
+                        # Add language and group info to notification
+                        notif_dict = notif.model_dump()
+                        notif_dict["language"] = language
+                        if "context" not in notif_dict:
+                            notif_dict["context"] = {}
+                        notif_dict["context"]["group_id"] = "general"
+                        notifications.append(NotificationData(**notif_dict))
             
             notify_duration = time.time() - notify_start
             logger.info(f"Generated {len(notifications)} notifications in {notify_duration:.2f}s")
@@ -685,10 +797,24 @@ async def process_city(city: str, days_ahead: int = 14, events_count: int = 10,
                 classification=classification,
                 notifications=notifications
             )
-            results.append(result)
-            
-            process_trace.metadata[f"event_{i}_cached"] = "false"
-            process_trace.metadata[f"event_{i}_processing_ms"] = str(processing_time_ms)
+            return result, False, processing_time_ms
+        
+        # Events are independent, so a fixed pool of workers processes them in
+        # parallel; results are still yielded in search order
+        event_results = map_ordered(
+            lambda item: process_event(*item), list(enumerate(events)), config.event_processing_concurrency
+        )
+        i = 0
+        async for result, cached, processing_time_ms in event_results:
+            if cached:
+                cache_hits += 1
+                process_trace.metadata[f"event_{i}_cached"] = "true"
+            else:
+                cache_misses += 1
+                process_trace.metadata[f"event_{i}_cached"] = "false"
+                process_trace.metadata[f"event_{i}_processing_ms"] = str(processing_time_ms)
+            i += 1
+            yield result
         
         # Update trace metadata
         total_duration = time.time() - total_start_time
@@ -708,7 +834,55 @@ async def process_city(city: str, days_ahead: int = 14, events_count: int = 10,
                 f"{stats['hit_rate']:.1f}% hit rate, "
                 f"{stats['database_size_mb']:.2f}MB"
             )
+
+
+async def process_city(city: str, days_ahead: int = 14, events_count: int = 10, config: Optional[DoraConfig] = None):
+    """Process a city to find events and generate notifications with caching.
+    
+    Args:
+        city: The city to process
+        days_ahead: Number of days ahead to search for events
+        events_count: Number of events to find and process
+        config: Application configuration
+        
+    Returns:
+        Processed results
+    """
+    return [
+        result
+        async for result in iter_city_results(city, days_ahead, events_count, config)
+    ]
+
+
+async def process_cities(
+    cities: List[str], days_ahead: int = 14, events_count: int = 10, config: Optional[DoraConfig] = None
+) -> Dict[str, List[FinalResult]]:
+    """Process several cities concurrently.
+    
+    Args:
+        cities: The cities to process
+        days_ahead: Number of days ahead to search for events
+        events_count: Number of events to find and process per city
+        config: Application configuration
+        
+    Returns:
+        Processed results keyed by city; cities that failed map to an empty list
+    """
+    if config is None:
+        config = DoraConfig()
     
+    city_results = await asyncio.gather(
+        *(process_city(city, days_ahead, events_count, config) for city in cities),
+        return_exceptions=True,
+    )
+    
+    results = {}
+    for city, city_result in zip(cities, city_results):
+        if isinstance(city_result, BaseException):
+            logger.error(f"Failed to process {city}: {city_result}")
+            results[city] = []
+        else:
+            results[city] = city_result
     return results
 
 
@@ -789,7 +963,8 @@ async def main_async():
             return
         
         # Format results for display and filter out None values (past events)
-        formatted_results = [format_notification_for_display(result) for result in results]
+        today = date.today()
+        formatted_results = [format_notification_for_display(result, today) for result in results]
         formatted_results = [result for result in formatted_results if result is not None]
         
         if not formatted_results:
@@ -853,7 +1028,14 @@ async def main_async():
 
 def main():
     """Run the Dora application."""
-    asyncio.run(main_async())
+    listener = configure_logging(getattr(logging, log_level, logging.INFO))
+    try:
+        if uvloop is not None:
+            uvloop.run(main_async())
+        else:
+            asyncio.run(main_async())
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":
@@ -1,11 +1,11 @@
 """Cached event processor for Dora."""
 
 import asyncio
-import json
 import time
 import logging
 from typing import Dict, List, Optional, Any
 
+import orjson
 from agents import Agent, Runner, trace
 from pydantic import BaseModel, Field
 
@@ -92,7 +92,7 @@ async def process_events_with_cache(
         # Classify the event
         classification_result = await Runner.run(
             event_classifier,
-            json.dumps(event_dict)
+            orjson.dumps(event_dict).decode()
         )
         classification = classification_result.final_output.classification
         
@@ -119,7 +119,7 @@ async def process_events_with_cache(
                 
                 notification_result = await Runner.run(
                     text_writer,
-                    json.dumps(notification_input)
+                    orjson.dumps(notification_input).decode()
                 )
                 
                 if notification_result.final_output and notification_result.final_output.notifications:
@@ -1,7 +1,9 @@
 """HTTP client for communicating with Dora HTTP server."""
 
+import asyncio
 import aiohttp
 import logging
+import orjson
 from typing import Optional, Dict, Any, List
 from urllib.parse import urljoin
 
@@ -11,12 +13,13 @@ logger = logging.getLogger(__name__)
 class DoraHTTPClient:
     """Client for communicating with Dora HTTP server."""
     
-    def __init__(self, base_url: str, api_key: Optional[str] = None):
+    def __init__(self, base_url: str, api_key: Optional[str] = None, timeout: float = 300.0):
         """Initialize the HTTP client.
         
         Args:
             base_url: Base URL of the Dora HTTP server (e.g., "http://localhost:8000")
             api_key: Optional API key for authentication
+            timeout: Overall and per-read timeout in seconds for each request
         """
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key
@@ -25,6 +28,39 @@ class DoraHTTPClient:
         }
         if api_key:
             self.headers['Authorization'] = f'Bearer {api_key}'
+        # Built once and shared by every request; connecting gets a short
+        # bound of its own so an unreachable server fails fast
+        self.timeout = aiohttp.ClientTimeout(total=timeout, sock_connect=5, sock_read=timeout)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_lock = asyncio.Lock()
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the pooled session, creating it on first use.
+        
+        Returns:
+            A session whose connections are kept alive across requests
+        """
+        async with self._session_lock:
+            if self._session is None or self._session.closed:
+                connector = aiohttp.TCPConnector(
+                    limit=100,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=75
+                )
+                self._session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+            return self._session
+    
+    async def close(self) -> None:
+        """Close the pooled session and its connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    async def __aenter__(self) -> "DoraHTTPClient":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
     
     async def chat_completion(
         self, 
@@ -70,18 +106,20 @@ class DoraHTTPClient:
         if response_format is not None:
             payload["response_format"] = response_format
         
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.post(
-                    url, 
-                    json=payload, 
-                    headers=self.headers
-                ) as response:
-                    response.raise_for_status()
-                    return await response.json()
-            except aiohttp.ClientError as e:
-                logger.error(f"HTTP request failed: {e}")
-                raise
+        session = await self._get_session()
+        try:
+            # Encode with orjson and send the bytes as-is; the JSON content type
+            # is already in self.headers
+            async with session.post(
+                url, 
+                data=orjson.dumps(payload), 
+                headers=self.headers
+            ) as response:
+                response.raise_for_status()
+                return await response.json(loads=orjson.loads)
+        except aiohttp.ClientError as e:
+            logger.error(f"HTTP request failed: {e}")
+            raise
     
     async def get_models(self) -> List[Dict[str, Any]]:
         """Get list of available models.
@@ -91,15 +129,15 @@ class DoraHTTPClient:
         """
         url = urljoin(self.base_url, '/v1/models')
         
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.get(url, headers=self.headers) as response:
-                    response.raise_for_status()
-                    data = await response.json()
-                    return data.get('data', [])
-            except aiohttp.ClientError as e:
-                logger.error(f"Failed to get models: {e}")
-                raise
+        session = await self._get_session()
+        try:
+            async with session.get(url, headers=self.headers) as response:
+                response.raise_for_status()
+                data = await response.json(loads=orjson.loads)
+                return data.get('data', [])
+        except aiohttp.ClientError as e:
+            logger.error(f"Failed to get models: {e}")
+            raise
     
     async def health_check(self) -> bool:
         """Check if the server is healthy.
@@ -109,12 +147,12 @@ class DoraHTTPClient:
         """
         url = urljoin(self.base_url, '/health')
         
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.get(url) as response:
-                    return response.status == 200
-            except aiohttp.ClientError:
-                return False
+        session = await self._get_session()
+        try:
+            async with session.get(url) as response:
+                return response.status == 200
+        except aiohttp.ClientError:
+            return False
     
     async def chat_completion_with_json(
         self,
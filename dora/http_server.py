@@ -1,22 +1,24 @@
 """OpenAI-compatible HTTP server for Dora."""
 
+import asyncio
 import time
 import uuid
-from typing import Dict, List, Optional, Union, Any, Type
-from datetime import datetime
+from typing import AsyncIterator, Callable, Dict, List, Optional, Union, Any, Type
+from datetime import datetime, timezone
 
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException, Header
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel, Field, create_model, Field as PydanticField
 import logging
-import json as json_module
+import orjson
 from agents import Agent, ModelSettings, Runner, set_default_openai_key
 
 from dora.models.config import DoraConfig
 from dora.models.event import EventNotification
 from dora.message_parser import MessageParser, ParsedQuery
-from dora.__main__ import process_city
+from dora.__main__ import iter_city_results, process_city
 
 logger = logging.getLogger(__name__)
 
@@ -127,29 +129,32 @@ def create_error_response(message: str, error_type: str = "invalid_request_error
     )
 
 
+# Static responses are serialized once at import time
+_ROOT_RESPONSE = orjson.dumps({
+    "message": "Dora OpenAI-Compatible API",
+    "version": "1.0.0",
+    "endpoints": {
+        "chat_completions": "/v1/chat/completions",
+        "models": "/v1/models"
+    }
+})
+
+
 @app.get("/")
 async def root():
     """Root endpoint."""
-    return {
-        "message": "Dora OpenAI-Compatible API",
-        "version": "1.0.0",
-        "endpoints": {
-            "chat_completions": "/v1/chat/completions",
-            "models": "/v1/models"
-        }
-    }
+    return Response(content=_ROOT_RESPONSE, media_type="application/json")
 
 
 @app.get("/health")
 async def health():
     """Health check endpoint."""
-    return {"status": "healthy", "timestamp": datetime.utcnow().isoformat()}
+    return {"status": "healthy", "timestamp": datetime.now(timezone.utc).isoformat()}
 
 
-@app.get("/v1/models")
-async def list_models():
-    """List available models."""
-    models = [
+_MODELS_RESPONSE = orjson.dumps({
+    "object": "list",
+    "data": [
         {
             "id": "dora-events-v1",
             "object": "model",
@@ -168,12 +173,14 @@ async def list_models():
             "root": "dora-events-fast",
             "parent": None,
         }
-    ]
-    
-    return {
-        "object": "list",
-        "data": models
-    }
+    ],
+})
+
+
+@app.get("/v1/models")
+async def list_models():
+    """List available models."""
+    return Response(content=_MODELS_RESPONSE, media_type="application/json")
 
 
 class ChatCompletionHandler:
@@ -193,17 +200,25 @@ class ChatCompletionHandler:
         lines = [f"I found {len(events)} upcoming events:\n"]
         
         for i, notification in enumerate(events, 1):
-            event = notification.event
-            lines.append(f"{i}. **{event.name}**")
-            lines.append(f"   📍 {event.location}")
-            lines.append(f"   📅 {event.start_date}")
-            if event.description:
-                # Truncate long descriptions
-                desc = event.description[:150] + "..." if len(event.description) > 150 else event.description
-                lines.append(f"   📝 {desc}")
-            if event.url and event.url != "https://example.com":
-                lines.append(f"   🔗 {event.url}")
-            lines.append("")
+            lines.append(self._format_event_as_text(i, notification))
+        
+        return "\n".join(lines)
+    
+    def _format_event_as_text(self, index: int, notification: EventNotification) -> str:
+        """Format a single event as a numbered text block."""
+        event = notification.event
+        lines = [
+            f"{index}. **{event.name}**",
+            f"   📍 {event.location}",
+            f"   📅 {event.start_date}",
+        ]
+        if event.description:
+            # Truncate long descriptions
+            desc = event.description[:150] + "..." if len(event.description) > 150 else event.description
+            lines.append(f"   📝 {desc}")
+        if event.url and event.url != "https://example.com":
+            lines.append(f"   🔗 {event.url}")
+        lines.append("")
         
         return "\n".join(lines)
     
@@ -284,10 +299,10 @@ class ChatCompletionHandler:
             events_data.append(notification_data)
         
         # Run the agent
-        result = await Runner.run(agent, json_module.dumps({"events": events_data}))
+        result = await Runner.run(agent, orjson.dumps({"events": events_data}).decode())
         
         # Return the formatted JSON
-        return json_module.dumps(result.final_output.model_dump())
+        return orjson.dumps(result.final_output.model_dump()).decode()
     
     def _format_events_as_json(self, events: List[EventNotification]) -> str:
         """Format events as JSON with full notification data."""
@@ -299,29 +314,36 @@ class ChatCompletionHandler:
             notif_dict = notification.model_dump(mode='json')
             notifications_data.append(notif_dict)
         
-        import json
-        return json.dumps({"notifications": notifications_data}, indent=2)
+        return orjson.dumps(
+            {"notifications": notifications_data}, option=orjson.OPT_INDENT_2
+        ).decode()
+    
+    async def _parse_query(self, request: ChatCompletionRequest) -> tuple[ParsedQuery, int]:
+        """Parse the query from the request messages and resolve the events count."""
+        messages_dict = [{"role": msg.role, "content": msg.content} for msg in request.messages]
+        parsed_query = await self._message_parser.parse(messages_dict)
+        
+        if not parsed_query or not parsed_query.city:
+            logger.warning(f"Failed to parse city from messages: {messages_dict}")
+            raise HTTPException(
+                status_code=400, 
+                detail="Could not determine which city to search for events. Please specify a city name."
+            )
+        
+        logger.info(f"Parsed query: city={parsed_query.city}, events={parsed_query.events_count}, days={parsed_query.days_ahead}")
+        
+        # Map model to events count if needed
+        events_count = parsed_query.events_count
+        if request.model == "dora-events-fast":
+            events_count = min(events_count, 5)  # Limit for fast model
+        
+        return parsed_query, events_count
     
     async def process_request(self, request: ChatCompletionRequest) -> ChatCompletionResponse:
         """Process a chat completion request."""
         try:
             # Parse the messages to extract query parameters
-            messages_dict = [{"role": msg.role, "content": msg.content} for msg in request.messages]
-            parsed_query = await self._message_parser.parse(messages_dict)
-            
-            if not parsed_query or not parsed_query.city:
-                logger.warning(f"Failed to parse city from messages: {messages_dict}")
-                raise HTTPException(
-                    status_code=400, 
-                    detail="Could not determine which city to search for events. Please specify a city name."
-                )
-            
-            logger.info(f"Parsed query: city={parsed_query.city}, events={parsed_query.events_count}, days={parsed_query.days_ahead}")
-            
-            # Map model to events count if needed
-            events_count = parsed_query.events_count
-            if request.model == "dora-events-fast":
-                events_count = min(events_count, 5)  # Limit for fast model
+            parsed_query, events_count = await self._parse_query(request)
             
             # Call Dora's process_city function
             results = await process_city(
@@ -381,19 +403,218 @@ class ChatCompletionHandler:
         except Exception as e:
             logger.error(f"Error processing request: {e}", exc_info=True)
             raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
+    
+    async def stream_request(self, request: ChatCompletionRequest) -> AsyncIterator[str]:
+        """Process a chat completion request as a stream of server-sent events.
+        
+        The query is parsed up front so that invalid requests still fail with a
+        regular error response; events are then streamed one chunk per event as
+        soon as each one has been processed.
+        """
+        parsed_query, events_count = await self._parse_query(request)
+        return self._stream_events(request, parsed_query, events_count)
+    
+    async def _stream_events(
+        self, request: ChatCompletionRequest, parsed_query: ParsedQuery, events_count: int
+    ) -> AsyncIterator[str]:
+        """Yield OpenAI-compatible completion chunks for each processed event."""
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+        created = int(time.time())
+        as_json = bool(request.response_format and request.response_format.type != "text")
+        
+        def chunk(delta: Dict[str, Any], finish_reason: Optional[str] = None) -> str:
+            payload = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": request.model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+            }
+            return f"data: {orjson.dumps(payload).decode()}\n\n"
+        
+        # Closing messages are coalesced into a single write
+        done = "data: [DONE]\n\n"
+        
+        yield chunk({"role": "assistant"})
+        
+        count = 0
+        try:
+            async for result in iter_city_results(
+                city=parsed_query.city,
+                days_ahead=parsed_query.days_ahead,
+                events_count=events_count,
+                config=self.config
+            ):
+                count += 1
+                if as_json:
+                    content = orjson.dumps(result.model_dump(mode='json')).decode() + "\n"
+                else:
+                    content = self._format_event_as_text(count, result)
+                yield chunk({"content": content})
+        except Exception as e:
+            logger.error(f"Error streaming request: {e}", exc_info=True)
+            # "error" is not a valid OpenAI finish_reason, so the stream ends normally
+            yield chunk({"content": f"Internal error: {str(e)}"}, finish_reason="stop") + done
+            return
+        
+        closing = chunk({}, finish_reason="stop") + done
+        if count == 0 and not as_json:
+            closing = chunk({"content": self._format_events_as_text([])}) + closing
+        yield closing
+    
+    async def stream_ndjson(self, request: ChatCompletionRequest) -> AsyncIterator[bytes]:
+        """Process a chat completion request as newline-delimited JSON events.
+        
+        Each processed event is serialized straight to bytes and sent on its
+        own line, without building the full response in memory.
+        """
+        parsed_query, events_count = await self._parse_query(request)
+        return self._ndjson_events(parsed_query, events_count)
+    
+    async def _ndjson_events(self, parsed_query: ParsedQuery, events_count: int) -> AsyncIterator[bytes]:
+        """Yield one JSON line per processed event."""
+        try:
+            async for result in iter_city_results(
+                city=parsed_query.city,
+                days_ahead=parsed_query.days_ahead,
+                events_count=events_count,
+                config=self.config
+            ):
+                yield orjson.dumps(result.model_dump(mode='json')) + b"\n"
+        except Exception as e:
+            logger.error(f"Error streaming request: {e}", exc_info=True)
+            yield orjson.dumps({"error": f"Internal error: {str(e)}"}) + b"\n"
 
 
 # Global handler instance
 completion_handler: Optional[ChatCompletionHandler] = None
 
+# Models accepted by the completions endpoint, in the order they are listed
+VALID_MODELS = ("dora-events-v1", "dora-events-fast", "gpt-4", "gpt-3.5-turbo")
+VALID_MODEL_SET = frozenset(VALID_MODELS)
+
+# Clients sending this Accept type get one JSON event per line
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Admission control for concurrent chat completions
+request_semaphore: Optional[asyncio.Semaphore] = None
+request_queue_timeout: float = 30.0
+
+
+async def acquire_request_slot() -> None:
+    """Wait for a free processing slot, failing with 503 when saturated."""
+    try:
+        await asyncio.wait_for(request_semaphore.acquire(), timeout=request_queue_timeout)
+    except asyncio.TimeoutError:
+        raise HTTPException(
+            status_code=503,
+            detail="Server is busy processing other requests. Please retry later."
+        )
+
+
+# Upper bound on pending stream chunks merged into a single write
+STREAM_COALESCE_MAX = 16
+
+
+async def coalesce_writes(events: AsyncIterator[Any], max_batch: int = STREAM_COALESCE_MAX) -> AsyncIterator[Any]:
+    """Merge stream chunks that are ready at the same time into one write.
+    
+    A producer task drains the source into a queue; each write takes the next
+    chunk plus up to ``max_batch - 1`` more that are already waiting, so bursts
+    of events go out in a single send instead of one send per chunk.
+    
+    Args:
+        events: Source stream of ``str`` or ``bytes`` chunks
+        max_batch: Maximum number of chunks joined into one write
+        
+    Returns:
+        Async iterator over the coalesced chunks
+    """
+    pending: asyncio.Queue = asyncio.Queue(maxsize=max_batch)
+    end = object()
+    
+    async def produce() -> None:
+        try:
+            async for chunk in events:
+                await pending.put(chunk)
+        except Exception as e:
+            await pending.put(e)
+            return
+        await pending.put(end)
+    
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            batch = [await pending.get()]
+            while len(batch) < max_batch and not pending.empty():
+                batch.append(pending.get_nowait())
+            
+            done = batch[-1] is end or isinstance(batch[-1], Exception)
+            chunks = batch[:-1] if done else batch
+            if chunks:
+                yield chunks[0][:0].join(chunks)
+            if done:
+                if batch[-1] is not end:
+                    raise batch[-1]
+                return
+    finally:
+        producer.cancel()
+
+
+def slot_releaser() -> Callable[[], None]:
+    """Create a callable that releases the held processing slot exactly once.
+    
+    Returns:
+        Release function that is safe to call from several cleanup paths
+    """
+    semaphore = request_semaphore
+    released = False
+    
+    def release() -> None:
+        nonlocal released
+        if not released:
+            released = True
+            semaphore.release()
+    
+    return release
+
+
+async def release_slot_when_done(events: AsyncIterator[Any], release: Callable[[], None]) -> AsyncIterator[Any]:
+    """Hold the processing slot until the stream finishes."""
+    try:
+        async for chunk in events:
+            yield chunk
+    finally:
+        release()
+
+
+class SlotStreamingResponse(StreamingResponse):
+    """Streaming response that frees its processing slot however the response ends.
+    
+    An async generator that is never iterated is never finalized, so a client
+    that disconnects before the first chunk would otherwise leak the slot.
+    """
+    
+    def __init__(self, content: AsyncIterator[Any], release: Callable[[], None], **kwargs: Any):
+        super().__init__(release_slot_when_done(content, release), **kwargs)
+        self._release = release
+    
+    async def __call__(self, scope, receive, send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            self._release()
+
 
 @asynccontextmanager
 async def lifespan(app_instance: FastAPI):
     """Application lifespan manager."""
     # Startup
-    global completion_handler
+    global completion_handler, request_semaphore, request_queue_timeout
     config = DoraConfig()
     completion_handler = ChatCompletionHandler(config)
+    request_semaphore = asyncio.Semaphore(config.http_max_concurrency)
+    request_queue_timeout = config.http_queue_timeout
     logger.info("Dora HTTP server started")
     yield
     # Shutdown
@@ -409,7 +630,8 @@ app.router.lifespan_context = lifespan
 @app.post("/v1/chat/completions", response_model=ChatCompletionResponse)
 async def create_chat_completion(
     request: ChatCompletionRequest,
-    authorization: Optional[str] = Header(None)
+    authorization: Optional[str] = Header(None),
+    accept: Optional[str] = Header(None)
 ) -> ChatCompletionResponse:
     """Create a chat completion."""
     # Log the incoming request
@@ -417,38 +639,52 @@ async def create_chat_completion(
     for i, msg in enumerate(request.messages):
         logger.info(f"Message {i+1} ({msg.role}): {msg.content}")
     
-    # Check if streaming is requested (not supported yet)
-    if request.stream:
-        raise HTTPException(
-            status_code=400,
-            detail="Streaming is not supported yet"
-        )
-    
     # Validate model
-    valid_models = ["dora-events-v1", "dora-events-fast", "gpt-4", "gpt-3.5-turbo"]
-    if request.model not in valid_models:
+    if request.model not in VALID_MODEL_SET:
         raise HTTPException(
             status_code=400,
-            detail=f"Model {request.model} not found. Available models: {', '.join(valid_models)}"
+            detail=f"Model {request.model} not found. Available models: {', '.join(VALID_MODELS)}"
         )
     
     # Process the request
     if completion_handler is None:
         raise HTTPException(status_code=500, detail="Service not initialized")
     
+    await acquire_request_slot()
+    
+    if accept and NDJSON_MEDIA_TYPE in accept:
+        release = slot_releaser()
+        try:
+            events = await completion_handler.stream_ndjson(request)
+        except BaseException:
+            release()
+            raise
+        return SlotStreamingResponse(coalesce_writes(events), release, media_type=NDJSON_MEDIA_TYPE)
+    
+    if request.stream:
+        release = slot_releaser()
+        try:
+            events = await completion_handler.stream_request(request)
+        except BaseException:
+            release()
+            raise
+        return SlotStreamingResponse(coalesce_writes(events), release, media_type="text/event-stream")
+    
     try:
         response = await completion_handler.process_request(request)
-        return response
+        # Serialize with pydantic-core directly instead of FastAPI re-validating
+        # the model and running it through jsonable_encoder and json.dumps
+        return Response(content=response.model_dump_json(), media_type="application/json")
     except Exception as e:
         logger.error(f"Error processing request: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        request_semaphore.release()
 
 
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request, exc: HTTPException):
     """Handle HTTP exceptions with OpenAI-compatible error format."""
-    from fastapi.responses import JSONResponse
-    
     error_response = ErrorResponse(
         error={
             "message": exc.detail,
@@ -0,0 +1,104 @@
+"""
+Logging configuration for Dora processes and agents.
+
+This module configures structlog and the stdlib root logger. Log calls below
+the configured level are filtered by the bound logger before any event dict is
+built. Accepted events are handed to a queue unrendered, and JSON rendering
+and stream I/O both happen on a background thread instead of the event loop.
+"""
+
+import logging
+import logging.handlers
+import queue
+from typing import Optional
+
+import orjson
+import structlog
+
+
+def _orjson_dumps(obj, **kwargs) -> str:
+    """Serialize a log event with orjson, returning text for stdlib handlers"""
+    return orjson.dumps(obj, **kwargs).decode()
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that leaves formatting to the listener thread"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The stock implementation formats the record in the caller's thread;
+        # records are consumed in-process, so they can be queued as they are
+        return record
+
+
+class _RootQueueListener(logging.handlers.QueueListener):
+    """Queue listener that detaches its queue handler from the root logger on stop"""
+
+    def __init__(self, queue_handler: logging.handlers.QueueHandler, *handlers: logging.Handler, **kwargs):
+        super().__init__(queue_handler.queue, *handlers, **kwargs)
+        self._queue_handler = queue_handler
+
+    def stop(self) -> None:
+        # Records logged after shutdown fall back to the remaining handlers
+        # instead of piling up in a queue nobody drains
+        logging.getLogger().removeHandler(self._queue_handler)
+        super().stop()
+
+
+def configure_logging(
+    level: int = logging.INFO,
+    handler: Optional[logging.Handler] = None,
+) -> logging.handlers.QueueListener:
+    """
+    Configure structlog and the stdlib root logger for a process.
+
+    Call this once from the process entry point. The queue handler is added
+    to the root logger next to any handlers already installed there, so entry
+    points should not also call logging.basicConfig.
+
+    Args:
+        level: Minimum log level; lower-level calls are dropped up front
+        handler: Final output handler, defaults to a stderr StreamHandler
+
+    Returns:
+        The started QueueListener; call stop() on shutdown to flush records
+        and detach the queue handler
+    """
+    timestamper = structlog.processors.TimeStamper(fmt="iso", utc=True)
+
+    handler = handler or logging.StreamHandler()
+    handler.setFormatter(structlog.stdlib.ProcessorFormatter(
+        processors=[
+            structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps),
+        ],
+        foreign_pre_chain=[
+            # Entry points log through stdlib loggers, so keep their names
+            structlog.stdlib.add_logger_name,
+            structlog.processors.add_log_level,
+            timestamper,
+            structlog.processors.format_exc_info,
+        ],
+    ))
+
+    queue_handler = _DeferredQueueHandler(queue.SimpleQueue())
+    listener = _RootQueueListener(queue_handler, handler, respect_handler_level=True)
+
+    root = logging.getLogger()
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+
+    structlog.configure(
+        processors=[
+            structlog.stdlib.add_logger_name,
+            structlog.processors.add_log_level,
+            timestamper,
+            structlog.processors.format_exc_info,
+            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
+        ],
+        wrapper_class=structlog.make_filtering_bound_logger(level),
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        cache_logger_on_first_use=True,
+    )
+
+    listener.start()
+    return listener
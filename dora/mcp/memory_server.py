@@ -166,6 +166,7 @@ class MemoryServer:
         """Store processed event data in cache."""
         event_id = self.generate_event_id(event_data)
         now = datetime.now(timezone.utc)
+        now_iso = now.isoformat()
         
         entry = EventCacheEntry(
             event_id=event_id,
@@ -190,8 +191,8 @@ class MemoryServer:
                 json.dumps(entry.event_data),
                 json.dumps(entry.classification),
                 json.dumps(entry.notifications),
-                entry.cached_at.isoformat(),
-                entry.last_accessed.isoformat(),
+                now_iso,
+                now_iso,
                 entry.hit_count,
                 entry.processing_time_ms,
                 entry.cache_version
@@ -1,15 +1,18 @@
 """Memory cache integration for Dora using direct database access."""
 
+import asyncio
 import os
 import sqlite3
-import json
 import hashlib
 import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Awaitable, Callable, Dict, Any, Hashable, Optional, List, Tuple
 import logging
 
+import orjson
+
 from dora.models.config import DoraConfig
 
 logger = logging.getLogger(__name__)
@@ -152,9 +155,9 @@ class MemoryCache:
                 # Parse and return the result
                 return {
                     "event_id": result[0],
-                    "event_data": json.loads(result[1]),
-                    "classification": json.loads(result[2]),
-                    "notifications": json.loads(result[3]),
+                    "event_data": orjson.loads(result[1]),
+                    "classification": orjson.loads(result[2]),
+                    "notifications": orjson.loads(result[3]),
                     "cached_at": result[4],
                     "last_accessed": result[5],
                     "hit_count": result[6],
@@ -178,7 +181,8 @@ class MemoryCache:
             
         try:
             event_id = self.generate_event_id(event_data)
-            now = datetime.now(timezone.utc)
+            # Format once; cached_at and last_accessed start out identical
+            now = datetime.now(timezone.utc).isoformat()
             
             with sqlite3.connect(self.db_path) as conn:
                 conn.execute("""
@@ -188,11 +192,11 @@ class MemoryCache:
                     VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """, (
                     event_id,
-                    json.dumps(event_data),
-                    json.dumps(classification),
-                    json.dumps(notifications),
-                    now.isoformat(),
-                    now.isoformat(),
+                    orjson.dumps(event_data).decode(),
+                    orjson.dumps(classification).decode(),
+                    orjson.dumps(notifications).decode(),
+                    now,
+                    now,
                     0,
                     processing_time_ms,
                     self.cache_version
@@ -245,4 +249,98 @@ class MemoryCache:
             }
         except Exception as e:
             logger.error(f"Error getting cache stats: {e}")
-            return None
\ No newline at end of file
+            return None
+
+
+class SearchResultCache:
+    """In-memory LRU cache with TTL for city search results.
+    
+    Concurrent lookups for the same key share a single in-flight call, so a
+    burst of identical requests only reaches the upstream search once.
+    """
+    
+    def __init__(self, max_size: int = 512, ttl_seconds: float = 300.0, empty_ttl_seconds: float = 15.0):
+        """Initialize the search result cache.
+        
+        Args:
+            max_size: Maximum number of cached entries
+            ttl_seconds: Seconds an entry stays fresh
+            empty_ttl_seconds: Seconds an empty result stays fresh, kept short so
+                a transient upstream miss is retried soon
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.empty_ttl_seconds = empty_ttl_seconds
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()  # key -> (expires_at, value)
+        # Per-key locks with the number of callers holding or waiting on each
+        self._locks: Dict[Hashable, Tuple[asyncio.Lock, int]] = {}
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a fresh cached value, or None on miss or expiry."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        expires_at, value = entry
+        if time.monotonic() > expires_at:
+            del self._entries[key]
+            return None
+        
+        self._entries.move_to_end(key)
+        return value
+    
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """Store a value, evicting the least recently used entry when full.
+        
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl_seconds: Freshness for this entry, defaults to the cache TTL
+        """
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+    
+    async def get_or_compute(
+        self,
+        key: Hashable,
+        compute: Callable[[], Awaitable[Any]],
+        is_empty: Optional[Callable[[Any], bool]] = None,
+    ) -> Any:
+        """Get a cached value, computing it once for concurrent callers on a miss.
+        
+        Args:
+            key: Cache key
+            compute: Coroutine factory producing the value on a miss
+            is_empty: Predicate marking results that only get empty_ttl_seconds
+            
+        Returns:
+            The cached or freshly computed value
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+        
+        lock, users = self._locks.get(key, (None, 0))
+        if lock is None:
+            lock = asyncio.Lock()
+        self._locks[key] = (lock, users + 1)
+        try:
+            async with lock:
+                # Another caller may have filled the entry while we waited
+                value = self.get(key)
+                if value is None:
+                    value = await compute()
+                    empty = is_empty is not None and is_empty(value)
+                    self.set(key, value, self.empty_ttl_seconds if empty else None)
+                return value
+        finally:
+            # Keep the lock while others still wait on it, so a failed compute
+            # hands over to the next waiter instead of a concurrent newcomer
+            lock, users = self._locks[key]
+            if users > 1:
+                self._locks[key] = (lock, users - 1)
+            else:
+                del self._locks[key]
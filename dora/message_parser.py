@@ -10,6 +10,44 @@ from agents import Agent, ModelSettings, Runner, set_default_openai_key
 
 logger = logging.getLogger(__name__)
 
+# Regex fallback patterns, compiled once at import time
+_CITY_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"(?:events?|concerts?|festivals?|shows?|happening) (?:in|at|near) ([A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)*)",
+        r"(?:find|show me|search|look for|what's happening in) ([A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)*)",
+        r"in ([A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)*)",
+    )
+)
+_CITY_SUFFIX_PATTERN = re.compile(
+    r'\s*(?:events?|concerts?|festivals?|shows?|next|this|for|tomorrow|today|\d+|days?).*$',
+    re.IGNORECASE
+)
+_EVENT_COUNT_PATTERN = re.compile(r'(\d+)\s*(?:events?|concerts?|festivals?|shows?)')
+_TIME_PATTERNS = (
+    (re.compile(r'next (\d+) days?'), lambda m: int(m.group(1))),
+    (re.compile(r'(?:for|in) (\d+) days?'), lambda m: int(m.group(1))),
+    (re.compile(r'next week'), lambda m: 7),
+    (re.compile(r'this week(?:end)?'), lambda m: 3),
+    (re.compile(r'tomorrow'), lambda m: 1),
+    (re.compile(r'today'), lambda m: 1),
+    (re.compile(r'next month'), lambda m: 30),
+)
+_EVENT_TYPE_KEYWORDS = ('concerts', 'festivals', 'sports', 'theater', 'exhibitions', 'shows', 'cultural')
+_EVENT_TYPE_PATTERN = re.compile('|'.join(_EVENT_TYPE_KEYWORDS))
+
+
+def _last_user_message(messages: List[Dict[str, str]]) -> Optional[Dict[str, str]]:
+    """Find the most recent user message, scanning from the end.
+    
+    Args:
+        messages: Conversation messages in chronological order
+        
+    Returns:
+        The last message with the user role, or None if there is none
+    """
+    return next((msg for msg in reversed(messages) if msg.get("role") == "user"), None)
+
 
 class ParsedQuery(BaseModel):
     """Parsed query parameters from chat messages."""
@@ -68,19 +106,20 @@ class MessageParser:
             self._parser_agent = self._create_parser_agent()
         
         # Get the last user message
-        user_messages = [msg for msg in messages if msg.get("role") == "user"]
-        if not user_messages:
+        user_message = _last_user_message(messages)
+        if user_message is None:
             return None
         
-        last_message = user_messages[-1].get("content", "")
+        last_message = user_message.get("content", "")
         
         # Add context from previous messages if available
         context = ""
         if len(messages) > 1:
-            context = "Previous conversation:\n"
-            for msg in messages[:-1]:
-                context += f"{msg.get('role', 'unknown')}: {msg.get('content', '')}\n"
-            context += "\nCurrent message to parse:\n"
+            history = "".join(
+                f"{msg.get('role', 'unknown')}: {msg.get('content', '')}\n"
+                for msg in messages[:-1]
+            )
+            context = f"Previous conversation:\n{history}\nCurrent message to parse:\n"
         
         prompt = f"{context}{last_message}"
         
@@ -98,19 +137,12 @@ class MessageParser:
         
         # Extract city using common patterns
         city = None
-        city_patterns = [
-            r"(?:events?|concerts?|festivals?|shows?|happening) (?:in|at|near) ([A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)*)",
-            r"(?:find|show me|search|look for|what's happening in) ([A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)*)",
-            r"in ([A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)*)",
-        ]
-        
-        for pattern in city_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _CITY_PATTERNS:
+            match = pattern.search(text)
             if match:
                 city = match.group(1).strip()
                 # Clean up common suffixes
-                suffix_pattern = r'\s*(?:events?|concerts?|festivals?|shows?|next|this|for|tomorrow|today|\d+|days?).*$'
-                city = re.sub(suffix_pattern, '', city, flags=re.IGNORECASE).strip()
+                city = _CITY_SUFFIX_PATTERN.sub('', city).strip()
                 # Validate it's a proper city name (starts with capital letter)
                 if city and city[0].isupper():
                     break
@@ -122,34 +154,25 @@ class MessageParser:
         
         # Extract event count
         events_count = 10
-        count_match = re.search(r'(\d+)\s*(?:events?|concerts?|festivals?|shows?)', text_lower)
+        count_match = _EVENT_COUNT_PATTERN.search(text_lower)
         if count_match:
             events_count = min(int(count_match.group(1)), 50)  # Cap at 50
         
         # Extract time range
         days_ahead = 14
-        time_patterns = [
-            (r'next (\d+) days?', lambda m: int(m.group(1))),
-            (r'(?:for|in) (\d+) days?', lambda m: int(m.group(1))),
-            (r'next week', lambda m: 7),
-            (r'this week(?:end)?', lambda m: 3),
-            (r'tomorrow', lambda m: 1),
-            (r'today', lambda m: 1),
-            (r'next month', lambda m: 30),
-        ]
-        
-        for pattern, extractor in time_patterns:
-            match = re.search(pattern, text_lower)
+        for pattern, extractor in _TIME_PATTERNS:
+            match = pattern.search(text_lower)
             if match:
                 days_ahead = extractor(match)
                 break
         
-        # Extract event types
-        event_types = []
-        type_keywords = ['concerts', 'festivals', 'sports', 'theater', 'exhibitions', 'shows', 'cultural']
-        for keyword in type_keywords:
-            if keyword in text_lower:
-                event_types.append(keyword.rstrip('s'))  # Remove plural
+        # Extract event types with a single scan, keeping keyword order
+        found_types = set(_EVENT_TYPE_PATTERN.findall(text_lower))
+        event_types = [
+            keyword.rstrip('s')  # Remove plural
+            for keyword in _EVENT_TYPE_KEYWORDS
+            if keyword in found_types
+        ]
         
         return ParsedQuery(
             city=city.title(),
@@ -167,9 +190,9 @@ class MessageParser:
             return result
         
         # Fallback to regex parsing
-        user_messages = [msg for msg in messages if msg.get("role") == "user"]
-        if user_messages:
-            last_message = user_messages[-1].get("content", "")
+        user_message = _last_user_message(messages)
+        if user_message is not None:
+            last_message = user_message.get("content", "")
             result = self.parse_regex(last_message)
             if result:
                 return result
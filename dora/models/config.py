@@ -35,6 +35,10 @@ class DoraConfig(BaseSettings):
     memory_cache_path: str = Field(default="./cache/dora_memory.db", env="MEMORY_CACHE_PATH")
     memory_cache_ttl_days: int = Field(default=7, env="MEMORY_CACHE_TTL_DAYS")
     memory_cache_max_size_mb: int = Field(default=100, env="MEMORY_CACHE_MAX_SIZE_MB")
+    search_cache_max_size: int = Field(default=512, env="SEARCH_CACHE_MAX_SIZE", description="Maximum cached city searches")
+    search_cache_ttl_seconds: float = Field(default=300.0, env="SEARCH_CACHE_TTL_SECONDS", description="Seconds a cached city search stays fresh")
+    search_cache_empty_ttl_seconds: float = Field(default=15.0, env="SEARCH_CACHE_EMPTY_TTL_SECONDS", description="Seconds a city search that found no events stays cached")
+    event_processing_concurrency: int = Field(default=4, env="EVENT_PROCESSING_CONCURRENCY", description="Events of one city processed in parallel")
     
     # HTTP Server configuration
     http_enabled: bool = Field(default=True, env="HTTP_ENABLED")
@@ -42,6 +46,8 @@ class DoraConfig(BaseSettings):
     http_port: int = Field(default=8000, env="HTTP_PORT")
     http_api_keys: List[str] = Field(default_factory=list, env="HTTP_API_KEYS", description="Comma-separated list of API keys")
     http_rate_limit: int = Field(default=100, env="HTTP_RATE_LIMIT", description="Requests per minute")
+    http_max_concurrency: int = Field(default=8, env="HTTP_MAX_CONCURRENCY", description="Maximum chat completions processed at once")
+    http_queue_timeout: float = Field(default=30.0, env="HTTP_QUEUE_TIMEOUT", description="Seconds to wait for a free slot before returning 503")
     
     # Agent Configurations
     orchestrator_config: AgentConfig = Field(
@@ -3,7 +3,7 @@
 import time
 import uuid
 from typing import Dict, List, Optional, Union, Any, Type
-from datetime import datetime
+from datetime import datetime, timezone
 import httpx
 import os
 from dotenv import load_dotenv
@@ -11,10 +11,10 @@ from dotenv import load_dotenv
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException, Header, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel, Field, create_model, Field as PydanticField
 import logging
-import json as json_module
+import orjson
 from agents import Agent, ModelSettings, Runner, set_default_openai_key
 
 from dora.models.config import DoraConfig
@@ -138,6 +138,23 @@ def create_error_response(message: str, error_type: str = "invalid_request_error
 PERPLEXITY_API_KEY = os.getenv("PERPLEXITY_API_KEY")
 PERPLEXITY_API_URL = "https://api.perplexity.ai/chat/completions"
 
+# Client headers passed through to Perplexity
+FORWARDED_HEADERS = frozenset({"accept", "accept-encoding", "user-agent"})
+
+# Shared client so proxied requests reuse pooled keep-alive connections
+perplexity_client: Optional[httpx.AsyncClient] = None
+
+
+def get_perplexity_client() -> httpx.AsyncClient:
+    """Get the shared Perplexity HTTP client, creating it on first use."""
+    global perplexity_client
+    if perplexity_client is None or perplexity_client.is_closed:
+        perplexity_client = httpx.AsyncClient(
+            timeout=60.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+    return perplexity_client
+
 
 async def proxy_to_perplexity(request_body: Dict[str, Any], headers: Dict[str, str]) -> JSONResponse:
     """Proxy request to Perplexity API."""
@@ -155,75 +172,77 @@ async def proxy_to_perplexity(request_body: Dict[str, Any], headers: Dict[str, s
     
     # Copy over any additional headers that might be useful
     for header, value in headers.items():
-        if header.lower() in ["accept", "accept-encoding", "user-agent"]:
+        if header.lower() in FORWARDED_HEADERS:
             perplexity_headers[header] = value
     
-    async with httpx.AsyncClient() as client:
-        try:
-            # Forward the request to Perplexity
-            response = await client.post(
-                PERPLEXITY_API_URL,
-                json=request_body,
-                headers=perplexity_headers,
-                timeout=60.0  # 60 second timeout
-            )
-            
-            # Return the response from Perplexity
-            return JSONResponse(
-                content=response.json(),
-                status_code=response.status_code,
-                headers={
-                    "Content-Type": "application/json",
-                    "X-Proxied-From": "perplexity"
-                }
-            )
-            
-        except httpx.TimeoutException:
-            raise HTTPException(
-                status_code=504,
-                detail="Request to Perplexity API timed out"
-            )
-        except httpx.RequestError as e:
-            logger.error(f"Error proxying to Perplexity: {e}")
-            raise HTTPException(
-                status_code=502,
-                detail=f"Error communicating with Perplexity API: {str(e)}"
-            )
-        except Exception as e:
-            logger.error(f"Unexpected error in Perplexity proxy: {e}")
-            raise HTTPException(
-                status_code=500,
-                detail=f"Internal server error: {str(e)}"
-            )
+    client = get_perplexity_client()
+    try:
+        # Forward the request to Perplexity
+        response = await client.post(
+            PERPLEXITY_API_URL,
+            json=request_body,
+            headers=perplexity_headers
+        )
+        
+        # Return the response from Perplexity
+        return JSONResponse(
+            content=response.json(),
+            status_code=response.status_code,
+            headers={
+                "Content-Type": "application/json",
+                "X-Proxied-From": "perplexity"
+            }
+        )
+        
+    except httpx.TimeoutException:
+        raise HTTPException(
+            status_code=504,
+            detail="Request to Perplexity API timed out"
+        )
+    except httpx.RequestError as e:
+        logger.error(f"Error proxying to Perplexity: {e}")
+        raise HTTPException(
+            status_code=502,
+            detail=f"Error communicating with Perplexity API: {str(e)}"
+        )
+    except Exception as e:
+        logger.error(f"Unexpected error in Perplexity proxy: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Internal server error: {str(e)}"
+        )
 
 
 
 
 # ================ ORIGINAL HTTP SERVER CODE BELOW ================
 
+# Static responses are serialized once at import time
+_ROOT_RESPONSE = orjson.dumps({
+    "message": "Perplexity Proxy Server",
+    "version": "1.0.0",
+    "endpoints": {
+        "chat_completions": "/v1/chat/completions (proxies to Perplexity)",
+        "models": "/v1/models"
+    }
+})
+
+
 @app.get("/")
 async def root():
     """Root endpoint."""
-    return {
-        "message": "Perplexity Proxy Server",
-        "version": "1.0.0",
-        "endpoints": {
-            "chat_completions": "/v1/chat/completions (proxies to Perplexity)",
-            "models": "/v1/models"
-        }
-    }
+    return Response(content=_ROOT_RESPONSE, media_type="application/json")
 
 
 @app.get("/health")
 async def health():
     """Health check endpoint."""
-    return {"status": "healthy", "timestamp": datetime.utcnow().isoformat()}
+    return {"status": "healthy", "timestamp": datetime.now(timezone.utc).isoformat()}
 
 
-@app.get("/v1/models")
-async def list_models():
-    """List available models (Perplexity models)."""
-    models = [
+_MODELS_RESPONSE = orjson.dumps({
+    "object": "list",
+    "data": [
         {
             "id": "llama-3.1-sonar-small-128k-online",
             "object": "model",
@@ -260,12 +279,14 @@ async def list_models():
             "root": "llama-3.1-sonar-large-128k-chat",
             "parent": None,
         }
-    ]
-    
-    return {
-        "object": "list",
-        "data": models
-    }
+    ],
+})
+
+
+@app.get("/v1/models")
+async def list_models():
+    """List available models (Perplexity models)."""
+    return Response(content=_MODELS_RESPONSE, media_type="application/json")
 
 
 class ChatCompletionHandler:
@@ -376,10 +397,10 @@ class ChatCompletionHandler:
             events_data.append(notification_data)
         
         # Run the agent
-        result = await Runner.run(agent, json_module.dumps({"events": events_data}))
+        result = await Runner.run(agent, orjson.dumps({"events": events_data}).decode())
         
         # Return the formatted JSON
-        return json_module.dumps(result.final_output.model_dump())
+        return orjson.dumps(result.final_output.model_dump()).decode()
     
     def _format_events_as_json(self, events: List[EventNotification]) -> str:
         """Format events as JSON with full notification data."""
@@ -391,8 +412,9 @@ class ChatCompletionHandler:
             notif_dict = notification.model_dump(mode='json')
             notifications_data.append(notif_dict)
         
-        import json
-        return json.dumps({"notifications": notifications_data}, indent=2)
+        return orjson.dumps(
+            {"notifications": notifications_data}, option=orjson.OPT_INDENT_2
+        ).decode()
     
     async def process_request(self, request: ChatCompletionRequest) -> ChatCompletionResponse:
         """Process a chat completion request."""
@@ -490,6 +512,8 @@ async def lifespan(app_instance: FastAPI):
     yield
     # Shutdown
     logger.info("Dora HTTP server shutting down")
+    if perplexity_client is not None:
+        await perplexity_client.aclose()
 
 
 # Update app with lifespan
@@ -523,8 +547,6 @@ async def create_chat_completion(
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request, exc: HTTPException):
     """Handle HTTP exceptions with OpenAI-compatible error format."""
-    from fastapi.responses import JSONResponse
-    
     error_response = ErrorResponse(
         error={
             "message": exc.detail,
@@ -2,14 +2,17 @@
 
 import asyncio
 import logging
-import json
+import os
 from datetime import datetime
+from typing import Optional
 
+import orjson
 from telegram import Update
 from telegram.ext import Application, CommandHandler, MessageHandler, filters, ContextTypes
 
 from dora.models.config import DoraConfig
 from dora.http_client import DoraHTTPClient
+from dora.logging_config import configure_logging
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -17,6 +20,12 @@ logger = logging.getLogger(__name__)
 # Authorized user
 AUTHORIZED_USER = "jewpacabra"
 
+# Maximum length of a single Telegram text message
+MAX_MESSAGE_LENGTH = 4096
+
+# Chat types in which the bot only answers when mentioned
+GROUP_CHAT_TYPES = frozenset({"group", "supergroup"})
+
 # Global state to track if bot is processing
 class BotState:
     def __init__(self):
@@ -63,11 +72,30 @@ class BotState:
 # Global bot state instance
 bot_state = BotState()
 
+# Shared HTTP client so requests to the Dora server reuse pooled connections
+http_client: Optional[DoraHTTPClient] = None
+
+
+def get_http_client(config: DoraConfig) -> DoraHTTPClient:
+    """Get the shared Dora HTTP client, creating it on first use."""
+    global http_client
+    if http_client is None:
+        http_url = f"http://{config.http_host}:{config.http_port}"
+        api_key = config.http_api_keys[0] if config.http_api_keys else None
+        http_client = DoraHTTPClient(http_url, api_key)
+    return http_client
+
+
+async def close_http_client(application: Application) -> None:
+    """Close the shared HTTP client when the bot shuts down."""
+    if http_client is not None:
+        await http_client.close()
+
 
 async def check_user(update: Update) -> bool:
     """Check if the user is authorized."""
     # Allow all users in groups (when bot is mentioned)
-    if update.effective_chat.type in ['group', 'supergroup']:
+    if update.effective_chat.type in GROUP_CHAT_TYPES:
         return True
     
     # For private chats, check if user is authorized
@@ -83,7 +111,7 @@ async def check_user(update: Update) -> bool:
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle the /start command."""
     # In groups, everyone can use the bot
-    if update.effective_chat.type in ['group', 'supergroup']:
+    if update.effective_chat.type in GROUP_CHAT_TYPES:
         bot_username = context.bot.username
         await update.message.reply_text(
             "🎭 Welcome to Dora the Explora!\n\n"
@@ -144,7 +172,7 @@ async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
     chat_type = update.effective_chat.type
     bot_username = context.bot.username
     
-    if chat_type in ['group', 'supergroup']:
+    if chat_type in GROUP_CHAT_TYPES:
         help_text = f"""🎭 **Dora the Explora - Event Discovery Bot**
 
 **How to use in groups:**
@@ -228,7 +256,7 @@ async def debug(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     
     # Get bot's member status in the group
     member_status = "Unknown"
-    if chat.type in ['group', 'supergroup']:
+    if chat.type in GROUP_CHAT_TYPES:
         try:
             bot_member = await context.bot.get_chat_member(chat.id, bot.id)
             member_status = bot_member.status
@@ -266,7 +294,7 @@ async def handle_city(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
     message_text = update.message.text.strip()
     
     # In groups, bot needs to be mentioned
-    if update.effective_chat.type in ['group', 'supergroup']:
+    if update.effective_chat.type in GROUP_CHAT_TYPES:
         bot_username = context.bot.username
         
         # Check if bot is mentioned
@@ -349,15 +377,13 @@ async def handle_city(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
         config = DoraConfig()
         
         # In groups, show fewer events to avoid spam
-        if update.effective_chat.type in ['group', 'supergroup']:
+        if update.effective_chat.type in GROUP_CHAT_TYPES:
             events_count = 3
         else:
             events_count = 10
         
-        # Create HTTP client
-        http_url = f"http://{config.http_host}:{config.http_port}"
-        api_key = config.http_api_keys[0] if config.http_api_keys else None
-        client = DoraHTTPClient(http_url, api_key)
+        # Get the shared HTTP client
+        client = get_http_client(config)
         
         # Build the message for the HTTP API
         message = f"{city} (events_count={events_count}, days_ahead=14)"
@@ -383,9 +409,9 @@ async def handle_city(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
             content = response['choices'][0]['message']['content']
             try:
                 # Parse the JSON response
-                data = json.loads(content)
+                data = orjson.loads(content)
                 results = data.get('notifications', [])
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 logger.error("Failed to parse JSON response from HTTP server")
                 results = None
         
@@ -422,7 +448,7 @@ async def send_results(update: Update, city: str, results: list) -> None:
     """Send formatted results to the user."""
     # In groups, mention the user who requested
     mention = ""
-    if update.effective_chat.type in ['group', 'supergroup']:
+    if update.effective_chat.type in GROUP_CHAT_TYPES:
         user = update.effective_user
         mention = f"@{user.username}, " if user.username else ""
     
@@ -444,66 +470,13 @@ async def send_results(update: Update, city: str, results: list) -> None:
         parse_mode="Markdown"
     )
     
-    # Send each event as a separate message
-    for event_count, result in enumerate(valid_events, 1):
-        event = result["event"]
-        classification = result["classification"]
-        notifications = result["notifications"]
-        
-        # Format the message
-        message = f"**{event_count}. {event['name']}**\n"
-        message += f"📅 {event['start_date']}\n"
-        if event['end_date']:
-            message += f"📅 End: {event['end_date']}\n"
-            
-        # Split location into venue and address
-        location_parts = event['location'].split(',', 1)
-        if len(location_parts) > 1:
-            venue = location_parts[0].strip()
-            address = location_parts[1].strip()
-            message += f"📍 Venue: {venue}\n"
-            message += f"🏢 Address: {address}\n"
-        else:
-            message += f"📍 {event['location']}\n"
-        
-        if event['url']:
-            message += f"🔗 [More info]({event['url']})\n"
-        
-        message += f"\n**Classification:**\n"
-        message += f"🏷️ Size: {classification['size']} | Importance: {classification['importance']}\n"
-        
-        # Handle target_audiences - could be strings or dicts
-        audiences = classification.get('target_audiences', [])
-        if audiences:
-            audience_strs = []
-            for aud in audiences:
-                if isinstance(aud, dict):
-                    # Build audience string from dict
-                    parts = []
-                    if aud.get('gender'):
-                        parts.append(aud['gender'])
-                    if aud.get('age_range'):
-                        parts.append(aud['age_range'])
-                    if aud.get('income_level'):
-                        parts.append(aud['income_level'])
-                    if aud.get('other_attributes'):
-                        parts.extend(aud['other_attributes'])
-                    audience_strs.append(' '.join(parts) if parts else 'General')
-                else:
-                    audience_strs.append(str(aud))
-            message += f"👥 Audience: {', '.join(audience_strs)}\n"
-        else:
-            message += f"👥 Audience: General\n"
-        
-        if notifications:
-            message += f"\n**Notifications:**\n"
-            # Show all notifications with language and group
-            for notification in notifications:
-                language = notification.get('language', 'en')
-                group = notification.get('context', {}).get('group_id', 'default')
-                message += f"💬 [{language}/{group}] _{notification['text']}_\n"
-        
-        # Send the event message
+    # Pack consecutive events into as few messages as Telegram allows
+    event_messages = [
+        format_event_message(event_count, result)
+        for event_count, result in enumerate(valid_events, 1)
+    ]
+    
+    for message in pack_messages(event_messages):
         try:
             await update.message.reply_text(message, parse_mode="Markdown")
         except Exception as e:
@@ -515,6 +488,92 @@ async def send_results(update: Update, city: str, results: list) -> None:
         await asyncio.sleep(0.5)
 
 
+def format_event_message(event_count: int, result: dict) -> str:
+    """Format a single event result as a Telegram message."""
+    event = result["event"]
+    classification = result["classification"]
+    notifications = result["notifications"]
+    
+    # Collect lines and join once at the end
+    lines = [
+        f"**{event_count}. {event['name']}**",
+        f"📅 {event['start_date']}",
+    ]
+    if event['end_date']:
+        lines.append(f"📅 End: {event['end_date']}")
+    
+    # Split location into venue and address
+    location_parts = event['location'].split(',', 1)
+    if len(location_parts) > 1:
+        venue = location_parts[0].strip()
+        address = location_parts[1].strip()
+        lines.append(f"📍 Venue: {venue}")
+        lines.append(f"🏢 Address: {address}")
+    else:
+        lines.append(f"📍 {event['location']}")
+    
+    if event['url']:
+        lines.append(f"🔗 [More info]({event['url']})")
+    
+    lines.append(f"\n**Classification:**")
+    lines.append(f"🏷️ Size: {classification['size']} | Importance: {classification['importance']}")
+    
+    # Handle target_audiences - could be strings or dicts
+    audiences = classification.get('target_audiences', [])
+    if audiences:
+        audience_strs = []
+        for aud in audiences:
+            if isinstance(aud, dict):
+                # Build audience string from dict
+                parts = []
+                if aud.get('gender'):
+                    parts.append(aud['gender'])
+                if aud.get('age_range'):
+                    parts.append(aud['age_range'])
+                if aud.get('income_level'):
+                    parts.append(aud['income_level'])
+                if aud.get('other_attributes'):
+                    parts.extend(aud['other_attributes'])
+                audience_strs.append(' '.join(parts) if parts else 'General')
+            else:
+                audience_strs.append(str(aud))
+        lines.append(f"👥 Audience: {', '.join(audience_strs)}")
+    else:
+        lines.append(f"👥 Audience: General")
+    
+    if notifications:
+        lines.append(f"\n**Notifications:**")
+        # Show all notifications with language and group
+        for notification in notifications:
+            language = notification.get('language', 'en')
+            group = notification.get('context', {}).get('group_id', 'default')
+            lines.append(f"💬 [{language}/{group}] _{notification['text']}_")
+    
+    return "\n".join(lines) + "\n"
+
+
+def pack_messages(messages: list, limit: int = MAX_MESSAGE_LENGTH) -> list:
+    """Join consecutive messages into batches that fit Telegram's length limit."""
+    batches = []
+    current = []
+    current_length = 0
+    
+    for message in messages:
+        added_length = len(message) + (1 if current else 0)
+        if current and current_length + added_length > limit:
+            batches.append("\n".join(current))
+            current = [message]
+            current_length = len(message)
+        else:
+            current.append(message)
+            current_length += added_length
+    
+    if current:
+        batches.append("\n".join(current))
+    
+    return batches
+
+
 async def error_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Log errors."""
     logger.error(f"Update {update} caused error {context.error}")
@@ -530,6 +589,21 @@ async def error_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 def main() -> None:
     """Start the bot."""
+    listener = configure_logging(getattr(logging, os.getenv("LOG_LEVEL", "INFO").upper(), logging.INFO))
+    
+    # Reduce verbosity for third-party libraries
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    logging.getLogger("telegram").setLevel(logging.WARNING)
+    logging.getLogger("urllib3").setLevel(logging.WARNING)
+    
+    try:
+        run_bot()
+    finally:
+        listener.stop()
+
+
+def run_bot() -> None:
+    """Build the bot application and poll for updates until shutdown."""
     # Get the token from config
     config = DoraConfig()
     telegram_token = config.telegram_api_key
@@ -539,7 +613,12 @@ def main() -> None:
         return
     
     # Create the Application
-    application = Application.builder().token(telegram_token).build()
+    application = (
+        Application.builder()
+        .token(telegram_token)
+        .post_shutdown(close_http_client)
+        .build()
+    )
     
     # Add error handler
     application.add_error_handler(error_handler)
@@ -568,16 +647,5 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    # Set up logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    )
-    
-    # Reduce verbosity for third-party libraries
-    logging.getLogger("httpx").setLevel(logging.WARNING)
-    logging.getLogger("telegram").setLevel(logging.WARNING)
-    logging.getLogger("urllib3").setLevel(logging.WARNING)
-    
     # Run the bot
     main()
\ No newline at end of file
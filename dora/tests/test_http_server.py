@@ -178,8 +178,8 @@ class TestHTTPServer:
         assert "error" in data
         assert "Service not initialized" in data["error"]["message"]
     
-    def test_chat_completion_streaming_not_supported(self, client):
-        """Test that streaming is not supported."""
+    def test_chat_completion_streaming_not_initialized(self, client):
+        """Test streaming request without service initialization."""
         request_data = {
             "model": "dora-events-v1",
             "messages": [
@@ -189,10 +189,54 @@ class TestHTTPServer:
         }
         
         response = client.post("/v1/chat/completions", json=request_data)
-        assert response.status_code == 400
+        # Should be 500 because completion_handler is None in tests
+        assert response.status_code == 500
         data = response.json()
         assert "error" in data
-        assert "Streaming is not supported" in data["error"]["message"]
+        assert "Service not initialized" in data["error"]["message"]
+
+    
+    @pytest.mark.asyncio
+    async def test_acquire_request_slot_saturated(self):
+        """Test that a saturated server rejects requests with 503."""
+        import asyncio
+        from fastapi import HTTPException
+        import dora.http_server as http_server
+        
+        with patch.object(http_server, "request_semaphore", asyncio.Semaphore(0)), \
+             patch.object(http_server, "request_queue_timeout", 0.01):
+            with pytest.raises(HTTPException) as exc_info:
+                await http_server.acquire_request_slot()
+        
+        assert exc_info.value.status_code == 503
+    
+    @pytest.mark.asyncio
+    async def test_stream_dropped_before_iteration_releases_slot(self):
+        """Test that a stream dropped before its first chunk frees its slot once."""
+        import asyncio
+        from starlette.requests import ClientDisconnect
+        import dora.http_server as http_server
+        
+        async def events():
+            yield "never sent"
+        
+        async def failing_send(message):
+            raise OSError("client disconnected")
+        
+        async def receive():
+            return {"type": "http.disconnect"}
+        
+        semaphore = asyncio.Semaphore(1)
+        with patch.object(http_server, "request_semaphore", semaphore):
+            await http_server.acquire_request_slot()
+            response = http_server.SlotStreamingResponse(
+                events(), http_server.slot_releaser(), media_type="text/event-stream"
+            )
+            with pytest.raises(ClientDisconnect):
+                await response({"type": "http", "asgi": {"spec_version": "2.4"}}, receive, failing_send)
+        
+        # Released exactly once, even though the generator never started
+        assert semaphore._value == 1
 
 
 class TestChatCompletionHandler:
@@ -239,6 +283,128 @@ class TestChatCompletionHandler:
         assert data["events"][0]["name"] == "Summer Music Festival"
         assert data["events"][0]["classification"]["size"] == "large"
     
+    @pytest.mark.asyncio
+    async def test_stream_request_yields_chunk_per_event(self, handler, mock_events):
+        """Test that streaming yields one completion chunk per event."""
+        handler._message_parser.parse = AsyncMock(
+            return_value=ParsedQuery(
+                city="New York",
+                events_count=10,
+                days_ahead=14
+            )
+        )
+        
+        async def fake_results(**kwargs):
+            for event in mock_events:
+                yield event
+        
+        from dora.http_server import ChatCompletionRequest, Message
+        request = ChatCompletionRequest(
+            model="dora-events-v1",
+            messages=[Message(role="user", content="Find events in New York")],
+            stream=True
+        )
+        
+        with patch('dora.http_server.iter_city_results', fake_results):
+            stream = await handler.stream_request(request)
+            writes = [write async for write in stream]
+        
+        # Each event is its own write; the stop chunk and [DONE] share the last one
+        assert len(writes) == 4
+        lines = "".join(writes).split("\n\n")[:-1]
+        assert lines[-1] == "data: [DONE]"
+        chunks = [json.loads(line[len("data: "):]) for line in lines[:-1]]
+        assert all(c["object"] == "chat.completion.chunk" for c in chunks)
+        assert chunks[0]["choices"][0]["delta"] == {"role": "assistant"}
+        contents = [c["choices"][0]["delta"].get("content") for c in chunks[1:-1]]
+        assert len(contents) == 2
+        assert "Summer Music Festival" in contents[0]
+        assert "Tech Conference 2025" in contents[1]
+        assert chunks[-1]["choices"][0]["finish_reason"] == "stop"
+    
+    @pytest.mark.asyncio
+    async def test_stream_request_error_ends_with_stop(self, handler, mock_events):
+        """Test that a failure mid-stream ends with an OpenAI-valid stop chunk."""
+        handler._message_parser.parse = AsyncMock(
+            return_value=ParsedQuery(
+                city="New York",
+                events_count=10,
+                days_ahead=14
+            )
+        )
+        
+        async def failing_results(**kwargs):
+            yield mock_events[0]
+            raise RuntimeError("search backend down")
+        
+        from dora.http_server import ChatCompletionRequest, Message
+        request = ChatCompletionRequest(
+            model="dora-events-v1",
+            messages=[Message(role="user", content="Find events in New York")],
+            stream=True
+        )
+        
+        with patch('dora.http_server.iter_city_results', failing_results):
+            stream = await handler.stream_request(request)
+            writes = [write async for write in stream]
+        
+        lines = "".join(writes).split("\n\n")[:-1]
+        assert lines[-1] == "data: [DONE]"
+        chunks = [json.loads(line[len("data: "):]) for line in lines[:-1]]
+        assert "Summer Music Festival" in chunks[1]["choices"][0]["delta"]["content"]
+        last = chunks[-1]["choices"][0]
+        assert last["finish_reason"] == "stop"
+        assert "search backend down" in last["delta"]["content"]
+        assert all(
+            c["choices"][0]["finish_reason"] in (None, "stop", "length", "tool_calls", "content_filter", "function_call")
+            for c in chunks
+        )
+    
+    @pytest.mark.asyncio
+    async def test_stream_ndjson_yields_line_per_event(self, handler, mock_events):
+        """Test that NDJSON streaming yields one JSON line per event."""
+        handler._message_parser.parse = AsyncMock(
+            return_value=ParsedQuery(
+                city="New York",
+                events_count=10,
+                days_ahead=14
+            )
+        )
+        
+        async def fake_results(**kwargs):
+            for event in mock_events:
+                yield event
+        
+        from dora.http_server import ChatCompletionRequest, Message
+        request = ChatCompletionRequest(
+            model="dora-events-v1",
+            messages=[Message(role="user", content="Find events in New York")]
+        )
+        
+        with patch('dora.http_server.iter_city_results', fake_results):
+            stream = await handler.stream_ndjson(request)
+            lines = [line async for line in stream]
+        
+        assert len(lines) == 2
+        assert all(line.endswith(b"\n") for line in lines)
+        events = [json.loads(line) for line in lines]
+        assert events[0]["event"]["name"] == "Summer Music Festival"
+        assert events[1]["event"]["name"] == "Tech Conference 2025"
+    
+    @pytest.mark.asyncio
+    async def test_coalesce_writes_merges_ready_chunks(self):
+        """Test that chunks already waiting are merged into one write."""
+        from dora.http_server import coalesce_writes
+        
+        async def burst():
+            for i in range(20):
+                yield f"data: {i}\n\n"
+        
+        writes = [write async for write in coalesce_writes(burst(), max_batch=8)]
+        
+        assert len(writes) < 20
+        assert "".join(writes) == "".join(f"data: {i}\n\n" for i in range(20))
+    
     @pytest.mark.asyncio
     @patch('dora.__main__.process_city')
     async def test_process_request_success(self, mock_process_city, handler, mock_events):
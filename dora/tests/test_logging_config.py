@@ -0,0 +1,88 @@
+"""Tests for the logging configuration."""
+
+import io
+import logging
+import threading
+
+import orjson
+import pytest
+import structlog
+
+from dora.logging_config import configure_logging
+
+
+@pytest.fixture
+def restore_logging():
+    """Restore structlog and root logger state after the test"""
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield
+    structlog.reset_defaults()
+    root.handlers, root.level = handlers, level
+
+
+def test_configure_logging_filters_and_renders_json(restore_logging):
+    """Test that debug calls are dropped and info is emitted as JSON via the queue"""
+    stream = io.StringIO()
+    listener = configure_logging(logging.INFO, handler=logging.StreamHandler(stream))
+
+    log = structlog.get_logger("test").bind(component="test")
+    log.debug("hidden")
+    log.info("shown", value=1)
+    listener.stop()
+
+    lines = stream.getvalue().splitlines()
+    assert len(lines) == 1
+    record = orjson.loads(lines[0])
+    assert record["event"] == "shown"
+    assert record["level"] == "info"
+    assert record["component"] == "test"
+    assert record["logger"] == "test"
+    assert record["value"] == 1
+
+
+def test_configure_logging_renders_stdlib_records(restore_logging):
+    """Test that plain stdlib log records are rendered as JSON too"""
+    stream = io.StringIO()
+    listener = configure_logging(logging.INFO, handler=logging.StreamHandler(stream))
+
+    logging.getLogger("plain").warning("disk %s", "full")
+    listener.stop()
+
+    record = orjson.loads(stream.getvalue())
+    assert record["event"] == "disk full"
+    assert record["level"] == "warning"
+    assert record["logger"] == "plain"
+
+
+def test_configure_logging_keeps_existing_handlers(restore_logging):
+    """Test that existing root handlers survive and stop() detaches the queue handler"""
+    existing = logging.NullHandler()
+    logging.getLogger().addHandler(existing)
+    stream = io.StringIO()
+
+    listener = configure_logging(logging.INFO, handler=logging.StreamHandler(stream))
+    root = logging.getLogger()
+    assert existing in root.handlers
+    assert len(root.handlers) == len(set(root.handlers))
+
+    listener.stop()
+    assert root.handlers[-1] is existing
+
+
+def test_configure_logging_renders_off_the_calling_thread(restore_logging):
+    """Test that records are formatted on the listener thread, not the caller's"""
+    rendered_on = []
+
+    class RecordingHandler(logging.StreamHandler):
+        def format(self, record):
+            rendered_on.append(threading.current_thread())
+            return super().format(record)
+
+    listener = configure_logging(logging.INFO, handler=RecordingHandler(io.StringIO()))
+    structlog.get_logger("test").info("shown")
+    logging.getLogger("plain").info("also shown")
+    listener.stop()
+
+    assert len(rendered_on) == 2
+    assert threading.current_thread() not in rendered_on
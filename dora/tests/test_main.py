@@ -0,0 +1,78 @@
+"""Tests for the Dora pipeline helpers."""
+
+import asyncio
+import gc
+
+import pytest
+
+from dora.__main__ import map_ordered
+
+
+async def delayed(value):
+    """Return value after a delay that makes later items finish first."""
+    await asyncio.sleep((5 - value) * 0.01)
+    if value == 3:
+        raise ValueError(value)
+    return value * 10
+
+
+class TestMapOrdered:
+    """Tests for the ordered worker pool."""
+    
+    @pytest.mark.asyncio
+    async def test_results_keep_input_order(self):
+        """Test that results come back in input order despite finishing out of order."""
+        results = [result async for result in map_ordered(delayed, [0, 1, 2], 3)]
+        
+        assert results == [0, 10, 20]
+    
+    @pytest.mark.asyncio
+    async def test_empty_input(self):
+        """Test that no items yield no results."""
+        assert [result async for result in map_ordered(delayed, [], 2)] == []
+    
+    @pytest.mark.asyncio
+    async def test_first_failure_is_raised_after_earlier_results(self, caplog):
+        """Test that a failure surfaces in order and sibling failures are not reported."""
+        results = []
+        with pytest.raises(ValueError):
+            async for result in map_ordered(delayed, [0, 1, 2, 3, 3, 4], 6):
+                results.append(result)
+        await asyncio.sleep(0.1)
+        gc.collect()
+        
+        assert results == [0, 10, 20]
+        assert "never retrieved" not in caplog.text
+    
+    @pytest.mark.asyncio
+    async def test_cancellation_inside_func_does_not_hang(self):
+        """Test that a cancellation raised by func resolves its result slot."""
+        async def cancelled(value):
+            if value == 1:
+                raise asyncio.CancelledError()
+            return value
+        
+        results = []
+        with pytest.raises(asyncio.CancelledError):
+            async with asyncio.timeout(1):
+                async for result in map_ordered(cancelled, [0, 1, 2], 1):
+                    results.append(result)
+        
+        assert results == [0]
+    
+    @pytest.mark.asyncio
+    async def test_early_close_cancels_workers(self):
+        """Test that closing the stream early stops the remaining work."""
+        started = []
+        
+        async def slow(value):
+            started.append(value)
+            await asyncio.sleep(0.05)
+            return value
+        
+        stream = map_ordered(slow, list(range(10)), 2)
+        assert await stream.__anext__() == 0
+        await stream.aclose()
+        await asyncio.sleep(0.1)
+        
+        assert len(started) < 10
@@ -0,0 +1,101 @@
+"""Unit tests for the in-memory search result cache."""
+
+import asyncio
+
+import pytest
+
+from dora.memory_cache import SearchResultCache
+
+
+class TestSearchResultCache:
+    """Test search result caching."""
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted when full."""
+        cache = SearchResultCache(max_size=2, ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1  # "b" is now least recently used
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_ttl_expiry(self):
+        """Test that expired entries are treated as misses."""
+        cache = SearchResultCache(max_size=2, ttl_seconds=0)
+        cache.set("a", 1)
+
+        assert cache.get("a") is None
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_compute_once(self):
+        """Test that concurrent lookups for one key share a single computation."""
+        cache = SearchResultCache()
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return ["event"]
+
+        results = await asyncio.gather(*(cache.get_or_compute("paris", compute) for _ in range(5)))
+
+        assert calls == 1
+        assert results == [["event"]] * 5
+        assert cache._locks == {}
+
+    @pytest.mark.asyncio
+    async def test_empty_results_use_short_ttl(self):
+        """Test that results flagged empty expire on the shorter TTL."""
+        cache = SearchResultCache(ttl_seconds=60, empty_ttl_seconds=0)
+
+        async def compute_empty():
+            return ([], ["en"])
+
+        async def compute_found():
+            return (["event"], ["en"])
+
+        is_empty = lambda result: not result[0]
+        await cache.get_or_compute("nowhere", compute_empty, is_empty=is_empty)
+        await cache.get_or_compute("paris", compute_found, is_empty=is_empty)
+
+        assert cache.get("nowhere") is None
+        assert cache.get("paris") == (["event"], ["en"])
+
+    @pytest.mark.asyncio
+    async def test_failed_compute_hands_lock_to_waiters(self):
+        """Test that waiters stay serialized after the first compute raises."""
+        cache = SearchResultCache()
+        running = 0
+        overlapped = False
+        calls = 0
+
+        async def compute():
+            nonlocal running, overlapped, calls
+            calls += 1
+            running += 1
+            overlapped = overlapped or running > 1
+            await asyncio.sleep(0.01)
+            running -= 1
+            if calls == 1:
+                raise RuntimeError("upstream failed")
+            return ["event"]
+
+        first = asyncio.create_task(cache.get_or_compute("paris", compute))
+        await asyncio.sleep(0)
+        waiters = [asyncio.create_task(cache.get_or_compute("paris", compute)) for _ in range(3)]
+        await asyncio.sleep(0)
+
+        with pytest.raises(RuntimeError):
+            await first
+        # A newcomer arriving after the failure must queue behind the waiters
+        late = asyncio.create_task(cache.get_or_compute("paris", compute))
+        results = await asyncio.gather(*waiters, late)
+
+        assert not overlapped
+        assert calls == 2
+        assert results == [["event"]] * 4
+        assert cache._locks == {}
@@ -17,6 +17,12 @@ from dora.tools import (
 class TestPerplexitySearch:
     """Test the perplexity_search function."""
     
+    @pytest.fixture(autouse=True)
+    def reset_http_client(self):
+        """Drop the shared client so each test builds one from the patched class."""
+        with patch('dora.tools._http_client', None):
+            yield
+    
     def test_no_api_key(self):
         """Test search without API key."""
         result = perplexity_search("test query", "")
@@ -41,7 +47,7 @@ class TestPerplexitySearch:
         # Mock the client
         mock_client = MagicMock()
         mock_client.post.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client
+        mock_client_class.return_value = mock_client
         
         result = perplexity_search("Find events in New York", "test_api_key")
         
@@ -70,7 +76,7 @@ class TestPerplexitySearch:
         # Mock the client
         mock_client = MagicMock()
         mock_client.post.side_effect = [mock_rate_limit_response, mock_success_response]
-        mock_client_class.return_value.__enter__.return_value = mock_client
+        mock_client_class.return_value = mock_client
         
         result = perplexity_search("Find events", "test_api_key", max_retries=2, initial_delay=0.1)
         
@@ -90,7 +96,7 @@ class TestPerplexitySearch:
         # Mock the client
         mock_client = MagicMock()
         mock_client.post.return_value = mock_error_response
-        mock_client_class.return_value.__enter__.return_value = mock_client
+        mock_client_class.return_value = mock_client
         
         result = perplexity_search("Find events", "test_api_key", max_retries=2, initial_delay=0.01)
         
@@ -107,7 +113,7 @@ class TestPerplexitySearch:
         # Mock the client
         mock_client = MagicMock()
         mock_client.post.side_effect = httpx.TimeoutException("Request timeout")
-        mock_client_class.return_value.__enter__.return_value = mock_client
+        mock_client_class.return_value = mock_client
         
         result = perplexity_search("Find events", "test_api_key", max_retries=2, initial_delay=0.01)
         
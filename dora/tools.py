@@ -11,6 +11,25 @@ from pydantic import BaseModel, Field
 
 logger = logging.getLogger(__name__)
 
+# Shared client so repeated searches reuse pooled keep-alive connections
+_http_client: Optional[httpx.Client] = None
+
+
+def get_http_client() -> httpx.Client:
+    """Get the shared HTTP client for tool calls, creating it on first use.
+    
+    Returns:
+        A pooled httpx.Client; it is thread-safe, so synchronous tools running
+        in worker threads can share it
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.Client(
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+    return _http_client
+
 
 class EventSearchResult(BaseModel):
     """Result from event search."""
@@ -61,42 +80,42 @@ def perplexity_search(query: str, api_key: str, max_retries: int = 3, initial_de
             logger.info(f"[PERPLEXITY] Attempt {attempt + 1}/{max_retries} - Sending request to API...")
             
             # Synchronous request since function_tool doesn't support async
-            with httpx.Client(timeout=30.0) as client:
-                response = client.post(url, headers=headers, json=data)
-                
-                # Check for rate limiting
-                if response.status_code == 429:
-                    retry_after = response.headers.get('Retry-After', str(int(delay)))
-                    wait_time = float(retry_after)
-                    logger.warning(f"[PERPLEXITY] Rate limited. Waiting {wait_time}s before retry...")
-                    time.sleep(wait_time)
+            client = get_http_client()
+            response = client.post(url, headers=headers, json=data)
+            
+            # Check for rate limiting
+            if response.status_code == 429:
+                retry_after = response.headers.get('Retry-After', str(int(delay)))
+                wait_time = float(retry_after)
+                logger.warning(f"[PERPLEXITY] Rate limited. Waiting {wait_time}s before retry...")
+                time.sleep(wait_time)
+                delay *= 2  # Exponential backoff
+                continue
+            
+            # Check for server errors that might be temporary
+            if response.status_code >= 500:
+                logger.warning(f"[PERPLEXITY] Server error {response.status_code}. Retrying...")
+                if attempt < max_retries - 1:
+                    time.sleep(delay)
                     delay *= 2  # Exponential backoff
                     continue
-                
-                # Check for server errors that might be temporary
-                if response.status_code >= 500:
-                    logger.warning(f"[PERPLEXITY] Server error {response.status_code}. Retrying...")
-                    if attempt < max_retries - 1:
-                        time.sleep(delay)
-                        delay *= 2  # Exponential backoff
-                        continue
-                
-                response.raise_for_status()
-                result = response.json()
-                
-                # Validate response structure
-                if not result.get("choices") or not result["choices"][0].get("message"):
-                    raise ValueError("Invalid response structure from Perplexity API")
-                
-                content = result["choices"][0]["message"].get("content", "")
-                
-                if not content:
-                    raise ValueError("Empty content received from Perplexity API")
-                
-                duration = time.time() - start_time
-                logger.info(f"[PERPLEXITY] Completed search in {duration:.2f} seconds, received {len(content)} characters")
-                return EventSearchResult(content=content)
-                
+            
+            response.raise_for_status()
+            result = response.json()
+            
+            # Validate response structure
+            if not result.get("choices") or not result["choices"][0].get("message"):
+                raise ValueError("Invalid response structure from Perplexity API")
+            
+            content = result["choices"][0]["message"].get("content", "")
+            
+            if not content:
+                raise ValueError("Empty content received from Perplexity API")
+            
+            duration = time.time() - start_time
+            logger.info(f"[PERPLEXITY] Completed search in {duration:.2f} seconds, received {len(content)} characters")
+            return EventSearchResult(content=content)
+            
         except httpx.TimeoutException as e:
             last_error = e
             logger.warning(f"[PERPLEXITY] Timeout on attempt {attempt + 1}: {e}")
@@ -8,10 +8,11 @@ using Pydantic for validation and serialization.
 from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional
-from uuid import uuid4
 
 from pydantic import BaseModel, Field
 
+from models.ids import new_id
+
 
 class CapabilityType(str, Enum):
     """Types of capabilities an agent can provide"""
@@ -68,7 +69,7 @@ class AgentCard(BaseModel):
 
 class A2AMessage(BaseModel):
     """Standard A2A message format"""
-    message_id: str = Field(default_factory=lambda: str(uuid4()), description="Unique message ID")
+    message_id: str = Field(default_factory=new_id, description="Unique message ID")
     sender_id: str = Field(..., description="Sender agent ID")
     recipient_id: str = Field(..., description="Recipient agent ID")
     message_type: MessageType = Field(..., description="Type of message")
@@ -117,7 +118,7 @@ class TaskStatus(str, Enum):
 
 class A2ATask(BaseModel):
     """Represents a task in the A2A system"""
-    task_id: str = Field(default_factory=lambda: str(uuid4()), description="Unique task ID")
+    task_id: str = Field(default_factory=new_id, description="Unique task ID")
     capability: str = Field(..., description="Capability to execute")
     parameters: Dict[str, Any] = Field(default_factory=dict, description="Task parameters")
     status: TaskStatus = Field(default=TaskStatus.PENDING, description="Current task status")
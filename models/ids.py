@@ -0,0 +1,43 @@
+"""
+Identifier generation for A2A messages
+
+Every message and envelope gets a random version-4 UUID in hex form, the
+same format as ``uuid4().hex``. Random bytes are read from the OS in blocks
+and sliced, so generating IDs does not cost a getrandom syscall each. The
+block is dropped in forked children so they never repeat their parent's IDs.
+"""
+
+import os
+import threading
+from uuid import UUID
+
+_ID_BYTES = 16
+_IDS_PER_BLOCK = 256
+
+_lock = threading.Lock()
+_block = b""
+_offset = 0
+
+
+def _reset_after_fork() -> None:
+    """Discard the inherited block and lock in a forked child"""
+    global _lock, _block, _offset
+    _lock = threading.Lock()
+    _block = b""
+    _offset = 0
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def new_id() -> str:
+    """Generate a random 32-character hex UUID4 identifier"""
+    global _block, _offset
+    with _lock:
+        if _offset >= len(_block):
+            _block = os.urandom(_ID_BYTES * _IDS_PER_BLOCK)
+            _offset = 0
+        chunk = _block[_offset:_offset + _ID_BYTES]
+        _offset += _ID_BYTES
+    return UUID(bytes=chunk, version=4).hex
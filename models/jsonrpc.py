@@ -8,10 +8,11 @@ communication as specified in the JSON-RPC 2.0 specification.
 from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional, Union
-from uuid import uuid4
 
 from pydantic import BaseModel, Field, validator
 
+from models.ids import new_id
+
 
 class JSONRPCVersion(str, Enum):
     """JSON-RPC version"""
@@ -58,7 +59,7 @@ class JSONRPCRequest(BaseModel):
     jsonrpc: JSONRPCVersion = Field(default=JSONRPCVersion.V2_0, description="JSON-RPC version")
     method: str = Field(..., description="Method name to invoke")
     params: Optional[Union[Dict[str, Any], List[Any]]] = Field(default=None, description="Method parameters")
-    id: Optional[Union[str, int]] = Field(default_factory=lambda: str(uuid4()), description="Request identifier")
+    id: Optional[Union[str, int]] = Field(default_factory=new_id, description="Request identifier")
 
     @validator('method')
     def validate_method_name(cls, v):
@@ -118,7 +119,7 @@ class A2AMessageEnvelope(BaseModel):
     This provides the transport layer information needed for agent communication.
     """
     # Transport metadata
-    envelope_id: str = Field(default_factory=lambda: str(uuid4()), description="Unique envelope ID")
+    envelope_id: str = Field(default_factory=new_id, description="Unique envelope ID")
     sender_id: str = Field(..., description="Sender agent ID")
     recipient_id: str = Field(..., description="Recipient agent ID")
     timestamp: datetime = Field(default_factory=datetime.utcnow, description="Message timestamp")
@@ -7,8 +7,9 @@ JSON schema validation, payload validation, and security checks.
 
 import json
 import re
+from collections import OrderedDict, deque
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple, Union
 
 import jsonschema
 import structlog
@@ -29,10 +30,15 @@ from models.jsonrpc import (
 
 logger = structlog.get_logger(__name__)
 
+# Known A2A method names for O(1) membership checks
+_A2A_METHODS = frozenset(method.value for method in A2AMethod)
+
 
 class ValidationResult:
     """Result of message validation"""
     
+    __slots__ = ("is_valid", "errors", "warnings")
+    
     def __init__(self, is_valid: bool = True, errors: Optional[List[str]] = None, 
                  warnings: Optional[List[str]] = None):
         self.is_valid = is_valid
@@ -79,10 +85,11 @@ class MessageValidator:
         self.max_payload_depth = 10
         self.allowed_agent_id_pattern = re.compile(r'^[a-zA-Z0-9._-]+$')
         
-        # Rate limiting tracking
-        self._agent_message_counts: Dict[str, List[datetime]] = {}
+        # Rate limiting tracking, least recently seen senders first
+        self._agent_message_counts: OrderedDict[str, Deque[datetime]] = OrderedDict()
         self.rate_limit_window = 60  # seconds
         self.rate_limit_max_messages = 1000  # per agent per minute
+        self.rate_limit_max_senders = 10_000  # senders tracked before evicting the idlest
     
     def register_capability(self, capability: Capability):
         """
@@ -118,16 +125,18 @@ class MessageValidator:
             ValidationResult indicating success/failure and any issues
         """
         result = ValidationResult()
+        # One clock read shared by the timestamp, expiry and rate-limit checks
+        now = datetime.utcnow()
         
         try:
             # Basic structure validation (already done by Pydantic, but double-check)
-            self._validate_envelope_structure(envelope, result)
+            self._validate_envelope_structure(envelope, result, now)
             
             # Security validation
             self._validate_security(envelope, result)
             
             # Business rules validation
-            self._validate_business_rules(envelope, result)
+            self._validate_business_rules(envelope, result, now)
             
             # JSON-RPC message validation
             self._validate_jsonrpc_message(envelope, result)
@@ -136,7 +145,7 @@ class MessageValidator:
             self._validate_capability_payload(envelope, result)
             
             # Rate limiting check
-            self._validate_rate_limits(envelope, result)
+            self._validate_rate_limits(envelope, result, now)
             
         except Exception as e:
             result.add_error(f"Validation error: {str(e)}")
@@ -146,7 +155,7 @@ class MessageValidator:
         
         return result
     
-    def _validate_envelope_structure(self, envelope: A2AMessageEnvelope, result: ValidationResult):
+    def _validate_envelope_structure(self, envelope: A2AMessageEnvelope, result: ValidationResult, now: datetime):
         """Validate basic envelope structure"""
         
         # Check required fields
@@ -167,7 +176,6 @@ class MessageValidator:
             result.add_error(f"Invalid recipient_id format: {envelope.recipient_id}")
         
         # Check timestamp is not too far in the past or future
-        now = datetime.utcnow()
         if envelope.timestamp:
             time_diff = abs((now - envelope.timestamp).total_seconds())
             if time_diff > 300:  # 5 minutes tolerance
@@ -195,17 +203,17 @@ class MessageValidator:
         if envelope.protocol_version != "1.0":
             result.add_warning(f"Unsupported protocol version: {envelope.protocol_version}")
     
-    def _validate_business_rules(self, envelope: A2AMessageEnvelope, result: ValidationResult):
+    def _validate_business_rules(self, envelope: A2AMessageEnvelope, result: ValidationResult, now: datetime):
         """Validate business logic rules"""
         
         # Check message age against TTL
         if envelope.timestamp:
-            message_age = (datetime.utcnow() - envelope.timestamp).total_seconds()
+            message_age = (now - envelope.timestamp).total_seconds()
             if message_age > envelope.ttl:
                 result.add_error(f"Message expired: age {message_age:.1f}s > TTL {envelope.ttl}s")
         
         # Validate correlation_id format if present
-        if envelope.correlation_id and not re.match(r'^[a-zA-Z0-9._-]+$', envelope.correlation_id):
+        if envelope.correlation_id and not self.allowed_agent_id_pattern.match(envelope.correlation_id):
             result.add_error(f"Invalid correlation_id format: {envelope.correlation_id}")
     
     def _validate_jsonrpc_message(self, envelope: A2AMessageEnvelope, result: ValidationResult):
@@ -249,7 +257,7 @@ class MessageValidator:
             result.add_error("Request ID is required for requests")
         
         # Validate known A2A methods
-        if request.method in A2AMethod.__members__.values():
+        if request.method in _A2A_METHODS:
             self._validate_a2a_method(request.method, request.params, result)
     
     def _validate_jsonrpc_response(self, response: JSONRPCResponse, result: ValidationResult):
@@ -358,27 +366,30 @@ class MessageValidator:
         except jsonschema.SchemaError as e:
             result.add_error(f"Invalid capability input schema: {e.message}")
     
-    def _validate_rate_limits(self, envelope: A2AMessageEnvelope, result: ValidationResult):
+    def _validate_rate_limits(self, envelope: A2AMessageEnvelope, result: ValidationResult, now: datetime):
         """Validate rate limiting for sender"""
         
         sender_id = envelope.sender_id
-        now = datetime.utcnow()
         
-        # Clean old entries
-        if sender_id in self._agent_message_counts:
+        # Clean old entries; timestamps are appended in order, so expired
+        # ones are always at the left end
+        timestamps = self._agent_message_counts.get(sender_id)
+        if timestamps is not None:
             cutoff_time = now - timedelta(seconds=self.rate_limit_window)
-            self._agent_message_counts[sender_id] = [
-                timestamp for timestamp in self._agent_message_counts[sender_id]
-                if timestamp > cutoff_time
-            ]
+            while timestamps and timestamps[0] <= cutoff_time:
+                timestamps.popleft()
+            self._agent_message_counts.move_to_end(sender_id)
         else:
-            self._agent_message_counts[sender_id] = []
+            timestamps = self._agent_message_counts[sender_id] = deque()
+            # Forget the least recently seen senders beyond the cap
+            while len(self._agent_message_counts) > self.rate_limit_max_senders:
+                self._agent_message_counts.popitem(last=False)
         
         # Add current message
-        self._agent_message_counts[sender_id].append(now)
+        timestamps.append(now)
         
         # Check rate limit
-        message_count = len(self._agent_message_counts[sender_id])
+        message_count = len(timestamps)
         if message_count > self.rate_limit_max_messages:
             result.add_error(f"Rate limit exceeded: {message_count} messages in {self.rate_limit_window}s")
     
@@ -12,12 +12,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 from dora.telegram_bot import main
 
 if __name__ == "__main__":
-    # Set up logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    )
-    
+    # Logging is configured by main()
     try:
         main()
     except KeyboardInterrupt:
@@ -9,25 +9,39 @@ import sys
 import uvicorn
 from dotenv import load_dotenv
 
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
+try:
+    import httptools
+except ImportError:  # fall back to the pure-Python h11 parser
+    httptools = None
+
 # Add the project root to the Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from dora.logging_config import configure_logging
 from dora.models.config import DoraConfig
 
 # Load environment variables
 load_dotenv()
 
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, os.getenv("LOG_LEVEL", "INFO").upper(), logging.INFO),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
-
 logger = logging.getLogger(__name__)
 
 
 def main():
     """Run the HTTP server."""
+    listener = configure_logging(getattr(logging, os.getenv("LOG_LEVEL", "INFO").upper(), logging.INFO))
+    try:
+        serve()
+    finally:
+        listener.stop()
+
+
+def serve():
+    """Start uvicorn with the configured app."""
     config = DoraConfig()
     
     if not config.openai_api_key:
@@ -46,6 +60,10 @@ def main():
         host=config.http_host,
         port=config.http_port,
         reload=os.getenv("DEBUG", "false").lower() == "true",
+        loop="uvloop" if uvloop is not None else "asyncio",
+        http="httptools" if httptools is not None else "h11",
+        ws="none",
+        access_log=os.getenv("HTTP_ACCESS_LOG", "false").lower() == "true",
         log_level=os.getenv("LOG_LEVEL", "info").lower(),
     )
 
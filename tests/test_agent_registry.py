@@ -198,6 +198,10 @@ class TestInMemoryAgentRegistry:
         assert len(agents) == 1
         assert agents[0].agent_id == another_agent_card.agent_id
         
+        # Unindexed capability finds nothing
+        query = RegistryQuery(capability_name="non_existent")
+        assert await registry.discover_agents(query) == []
+        
         await registry.stop()
     
     @pytest.mark.asyncio
@@ -263,6 +267,32 @@ class TestInMemoryAgentRegistry:
         
         await registry.stop()
     
+    @pytest.mark.asyncio
+    async def test_discover_agents_by_status_follows_transitions(self, registry, test_agent_card):
+        """Test status queries see cleanup and heartbeat status changes"""
+        await registry.register_agent(test_agent_card)
+        offline_query = RegistryQuery(agent_status=AgentStatus.OFFLINE, include_offline=True)
+        ready_query = RegistryQuery(agent_status=AgentStatus.READY)
+        
+        # Mark the agent stale
+        entry = registry._agents[test_agent_card.agent_id]
+        entry.last_heartbeat = datetime.utcnow() - timedelta(seconds=200)
+        entry.heartbeat_interval = 30
+        await registry._cleanup_stale_agents()
+        
+        assert [a.agent_id for a in await registry.discover_agents(offline_query)] == [test_agent_card.agent_id]
+        assert await registry.discover_agents(ready_query) == []
+        
+        # Heartbeat brings it back to READY
+        await registry.heartbeat(test_agent_card.agent_id)
+        
+        assert await registry.discover_agents(offline_query) == []
+        assert [a.agent_id for a in await registry.discover_agents(ready_query)] == [test_agent_card.agent_id]
+        
+        # Unregistered agents leave the index
+        await registry.unregister_agent(test_agent_card.agent_id)
+        assert registry._statuses == {}
+    
     @pytest.mark.asyncio
     async def test_list_capabilities(self, registry, test_agent_card, another_agent_card):
         """Test listing capabilities"""
@@ -316,6 +346,15 @@ class TestInMemoryAgentRegistry:
         
         await registry.stop()
     
+    @pytest.mark.asyncio
+    async def test_reregistration_replaces_capability_index(self, registry, test_agent_card):
+        """Test that registering an agent again drops its old capabilities from the indexes"""
+        await registry.register_agent(test_agent_card)
+        await registry.register_agent(test_agent_card.model_copy(update={"capabilities": []}))
+        
+        assert await registry.find_agents_with_capability("test_capability") == []
+        assert (await registry.get_stats())["total_capabilities"] == 0
+    
     @pytest.mark.asyncio
     async def test_cleanup_stale_agents(self, registry, test_agent_card):
         """Test cleanup of stale agents"""
@@ -366,6 +405,34 @@ class TestInMemoryAgentRegistry:
         assert stats["total_capabilities"] == 3  # test, analysis, shared
         
         await registry.stop()
+    
+    @pytest.mark.asyncio
+    async def test_online_count_tracks_transitions(self, registry, test_agent_card, another_agent_card):
+        """Test online count follows offline, heartbeat and unregister transitions"""
+        await registry.register_agent(test_agent_card)
+        await registry.register_agent(another_agent_card)
+        
+        # Mark one agent stale; repeated cleanup passes must not double count
+        entry = registry._agents[test_agent_card.agent_id]
+        entry.last_heartbeat = datetime.utcnow() - timedelta(seconds=200)
+        entry.heartbeat_interval = 30
+        await registry._cleanup_stale_agents()
+        await registry._cleanup_stale_agents()
+        
+        stats = await registry.get_stats()
+        assert stats["online_agents"] == 1
+        assert stats["offline_agents"] == 1
+        
+        # Heartbeat brings it back online
+        await registry.heartbeat(test_agent_card.agent_id)
+        assert (await registry.get_stats())["online_agents"] == 2
+        
+        # Re-registration and unregistration keep the count consistent
+        await registry.register_agent(test_agent_card)
+        await registry.unregister_agent(another_agent_card.agent_id)
+        stats = await registry.get_stats()
+        assert stats["online_agents"] == 1
+        assert stats["offline_agents"] == 0
 
 
 class TestDefaultRegistry:
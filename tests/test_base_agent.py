@@ -4,7 +4,7 @@ Tests for the base agent class
 
 import asyncio
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any, Dict
 
 from agents.base import BaseAgent
@@ -128,6 +128,21 @@ class TestBaseAgent:
         assert len(card.capabilities) == 1
         assert card.capabilities[0] == test_capability
     
+    def test_capabilities_dump_cache(self, test_agent, test_capability):
+        """Test capability dump is cached and invalidated on registration"""
+        assert test_agent._dump_capabilities() == []
+        
+        test_agent.register_capability(test_capability)
+        dump = test_agent._dump_capabilities()
+        assert [cap["name"] for cap in dump] == ["test_capability"]
+        assert test_agent._dump_capabilities() is dump
+        assert test_agent._dump_capability("test_capability") is dump[0]
+        
+        test_agent.register_capability(test_capability.model_copy(update={"name": "other"}))
+        assert [cap["name"] for cap in test_agent._dump_capabilities()] == [
+            "test_capability", "other"
+        ]
+    
     def test_metrics(self, test_agent):
         """Test agent metrics"""
         metrics = test_agent.metrics
@@ -183,6 +198,42 @@ class TestBaseAgent:
         
         await test_agent.stop()
     
+    @pytest.mark.asyncio
+    async def test_memoized_capability_results(self, test_agent, test_capability):
+        """Test memoized capabilities run once per distinct set of parameters"""
+        test_agent.register_capability(test_capability)
+        test_agent.memoized_capabilities = frozenset({"test_capability"})
+        
+        calls = []
+        execute = test_agent._execute_capability_impl
+        
+        async def counting_execute(capability_name, parameters):
+            calls.append(parameters)
+            return await execute(capability_name, parameters)
+        
+        test_agent._execute_capability_impl = counting_execute
+        
+        first = await test_agent.execute_capability("test_capability", {"query": "a", "limit": 1})
+        # Same parameters in a different key order hit the cache
+        second = await test_agent.execute_capability("test_capability", {"limit": 1, "query": "a"})
+        assert second == first
+        assert len(calls) == 1
+        
+        # Neither the first result nor a hit shares state with the cached snapshot
+        first["mutated"] = True
+        second["mutated"] = True
+        third = await test_agent.execute_capability("test_capability", {"query": "a", "limit": 1})
+        assert "mutated" not in third
+        assert len(calls) == 1
+        
+        await test_agent.execute_capability("test_capability", {"query": "b"})
+        assert len(calls) == 2
+        
+        test_agent.invalidate_capability_result("test_capability", {"query": "a", "limit": 1})
+        await test_agent.execute_capability("test_capability", {"query": "a", "limit": 1})
+        assert len(calls) == 3
+        assert test_agent.metrics.successful_requests == 5
+    
     @pytest.mark.asyncio
     async def test_capability_execution_error(self, test_agent):
         """Test capability execution with error"""
@@ -280,6 +331,9 @@ class TestBaseAgent:
         
         # Agent should be busy
         assert test_agent.status == AgentStatus.BUSY
+        running = next(iter(test_agent._active_tasks.values()))
+        assert running.status == TaskStatus.IN_PROGRESS
+        assert running.created_at == running.started_at
         
         # Wait for completion
         result = await task
@@ -288,4 +342,53 @@ class TestBaseAgent:
         # Agent should be ready again
         assert test_agent.status == AgentStatus.READY
         
-        await test_agent.stop()
\ No newline at end of file
+        await test_agent.stop()
+    
+    @pytest.mark.asyncio
+    async def test_cleanup_expired_tasks(self, test_agent, test_capability):
+        """Test that only tasks finished over an hour ago are cleaned up"""
+        test_agent.register_capability(test_capability)
+        
+        await test_agent.execute_capability("test_capability", {"query": "old"})
+        await test_agent.execute_capability("test_capability", {"query": "new"})
+        assert len(test_agent._active_tasks) == 2
+        
+        # Age the first finished task past the expiry window
+        completed_at, task_id = test_agent._finished_tasks[0]
+        test_agent._finished_tasks[0] = (completed_at - timedelta(hours=2), task_id)
+        
+        await test_agent._cleanup_expired_tasks()
+        
+        assert task_id not in test_agent._active_tasks
+        assert len(test_agent._active_tasks) == 1
+        assert len(test_agent._finished_tasks) == 1
+    
+    @pytest.mark.asyncio
+    async def test_coarse_clock(self, test_agent):
+        """Test that timestamps come from the coarse clock only while running"""
+        assert test_agent._clock is None
+        assert isinstance(test_agent._utcnow(), datetime)
+        
+        await test_agent.start()
+        await asyncio.sleep(0)
+        assert test_agent._clock is not None
+        assert test_agent._utcnow() is test_agent._clock
+        assert test_agent._utcnow_iso() == test_agent._clock.isoformat()
+        
+        await test_agent.stop()
+        assert test_agent._clock is None
+        assert test_agent._clock_iso is None
+    
+    @pytest.mark.asyncio
+    async def test_finished_tasks_are_bounded(self, test_agent, test_capability):
+        """Test that the oldest finished tasks are evicted beyond the cap"""
+        test_agent.register_capability(test_capability)
+        test_agent.max_finished_tasks = 2
+        
+        for i in range(3):
+            await test_agent.execute_capability("test_capability", {"query": str(i)})
+        
+        assert len(test_agent._active_tasks) == 2
+        assert len(test_agent._finished_tasks) == 2
+        remaining = [task.parameters["query"] for task in test_agent._active_tasks.values()]
+        assert remaining == ["1", "2"]
@@ -11,7 +11,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime
 
 from agents.base import BaseAgent
-from models.a2a import Capability, CapabilityType, AgentStatus
+from models.a2a import A2ARequest, Capability, CapabilityType, AgentStatus, MessageType
 from models.jsonrpc import (
     A2AMessageEnvelope,
     JSONRPCRequest,
@@ -232,6 +232,26 @@ class TestBaseAgentMessaging:
         assert error_response.error.code == JSONRPCErrorCode.INTERNAL_ERROR
         assert "Execution failed" in error_response.error.message
     
+    @pytest.mark.asyncio
+    async def test_legacy_request_uses_jsonrpc_path(self, agent):
+        """Test legacy A2A requests are converted and handled via JSON-RPC"""
+        request = A2ARequest(
+            sender_id="client_agent",
+            recipient_id="test_agent",
+            capability="test_capability",
+            parameters={"input": "legacy"}
+        )
+        
+        sent_messages = []
+        agent.send_message = AsyncMock(side_effect=lambda env: sent_messages.append(env))
+        
+        await agent._message_handlers[MessageType.REQUEST](request)
+        
+        assert len(sent_messages) == 1
+        response_envelope = sent_messages[0]
+        assert isinstance(response_envelope.jsonrpc_message, JSONRPCResponse)
+        assert response_envelope.recipient_id == "client_agent"
+    
     @pytest.mark.asyncio
     async def test_list_capabilities_request(self, agent):
         """Test list capabilities request"""
@@ -152,6 +152,25 @@ class TestCapabilityDiscoveryMixin:
         
         await test_registry.stop()
     
+    @pytest.mark.asyncio
+    async def test_registration_retried_in_background(self, discovery_agent):
+        """Test failed registration is retried in the background with backoff"""
+        registry = MagicMock()
+        registry.register_agent = AsyncMock(side_effect=[False, False, True])
+        registry.unregister_agent = AsyncMock(return_value=True)
+        discovery_agent._registration_retry_delay = 0.01
+        
+        # Setup should not block on the failed registration
+        await discovery_agent._setup_discovery(registry)
+        assert registry.register_agent.call_count == 1
+        assert discovery_agent._registration_task is not None
+        
+        assert await discovery_agent._registration_task is True
+        assert registry.register_agent.call_count == 3
+        
+        await discovery_agent._cleanup_discovery()
+        assert discovery_agent._registration_task is None
+    
     @pytest.mark.asyncio
     async def test_cleanup_discovery(self, discovery_agent, test_registry):
         """Test discovery cleanup"""
@@ -344,6 +363,30 @@ class TestCapabilityDiscoveryMixin:
         await discovery_agent._cleanup_discovery()
         await test_registry.stop()
     
+    @pytest.mark.asyncio
+    async def test_evict_agent_from_cache(self, discovery_agent, test_registry, sample_agents):
+        """Test discovery seeds per-agent entries and eviction removes a failed agent"""
+        await test_registry.start()
+        
+        for agent in sample_agents:
+            await test_registry.register_agent(agent)
+        
+        await discovery_agent._setup_discovery(test_registry)
+        
+        agents = await discovery_agent.discover_agents_with_capability("data_collection")
+        assert len(agents) == 2
+        failed_id = agents[0].agent_id
+        assert discovery_agent._is_cache_valid(f"agent:{failed_id}")
+        
+        discovery_agent.evict_agent_from_cache(failed_id)
+        
+        assert f"agent:{failed_id}" not in discovery_agent._discovery_cache
+        cached = await discovery_agent.discover_agents_with_capability("data_collection")
+        assert [agent.agent_id for agent in cached] == [agents[1].agent_id]
+        
+        await discovery_agent._cleanup_discovery()
+        await test_registry.stop()
+    
     @pytest.mark.asyncio
     async def test_cache_ttl(self, discovery_agent, test_registry, sample_agents):
         """Test cache TTL behavior"""
@@ -5,9 +5,12 @@ This module contains comprehensive tests for the JSON-RPC message models
 and helper functions used in A2A communication.
 """
 
+import os
 import pytest
 from datetime import datetime
-from uuid import uuid4
+from uuid import UUID, uuid4
+
+from models.ids import new_id
 
 from models.jsonrpc import (
     JSONRPCVersion,
@@ -86,6 +89,32 @@ class TestJSONRPCRequest:
         assert isinstance(request.id, str)
         assert len(request.id) > 0
     
+    def test_default_ids_are_unique_hex(self):
+        """Test generated IDs are unique uuid4 hex strings across random block refills"""
+        ids = {JSONRPCRequest(method="test.method").id for _ in range(1000)}
+        
+        assert len(ids) == 1000
+        assert all(UUID(hex=request_id).version == 4 for request_id in ids)
+        assert all(UUID(hex=request_id).hex == request_id for request_id in ids)
+    
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_forked_child_does_not_repeat_parent_ids(self):
+        """Test a forked child draws fresh random bytes instead of the parent's block"""
+        new_id()  # make sure the parent holds a partly used block
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            os.write(write_fd, "".join(new_id() for _ in range(8)).encode())
+            os._exit(0)
+        os.close(write_fd)
+        with os.fdopen(read_fd) as reader:
+            child_ids = reader.read()
+        os.waitpid(pid, 0)
+        parent_ids = "".join(new_id() for _ in range(8))
+        
+        assert child_ids != parent_ids
+    
     def test_request_without_params(self):
         """Test request without parameters"""
         request = JSONRPCRequest(method="test.method", id="123")
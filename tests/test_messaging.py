@@ -9,7 +9,7 @@ import asyncio
 import gzip
 import json
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from models.a2a import A2AMessage, A2ARequest, A2AResponse, A2AError, MessageType
 from models.jsonrpc import (
@@ -30,6 +30,7 @@ from agents.messaging import (
     A2AMessageSerializer,
     A2AMessageConverter,
     MessageRouter,
+    MessageBatcher,
     MessageSerializationError,
     MessageDeserializationError,
     get_message_router,
@@ -112,14 +113,30 @@ class TestA2AMessageSerializer:
         deserialized = serializer.deserialize_message(message_bytes)
         assert deserialized.sender_id == envelope.sender_id
     
+    def test_zstd_compression(self):
+        """Test zstd message compression round trip"""
+        zstandard = pytest.importorskip("zstandard")
+        serializer = A2AMessageSerializer(compression_threshold=100, compression_algorithm="zstd")
+        envelope = create_capability_request(
+            sender_id="agent1",
+            recipient_id="agent2",
+            capability_name="test_capability",
+            parameters={"data": "x" * 1000}
+        )
+        
+        message_bytes = serializer.serialize_message(envelope)
+        
+        assert message_bytes.startswith(b"\x28\xb5\x2f\xfd")
+        assert zstandard.ZstdDecompressor().decompress(message_bytes)
+        assert serializer.deserialize_message(message_bytes).sender_id == "agent1"
+    
     def test_serialization_error_handling(self):
         """Test serialization error handling"""
         serializer = A2AMessageSerializer()
         
         # Create an invalid envelope that will cause serialization issues
-        # We'll use a mock that raises an exception during dict() call
+        # A mock is not a pydantic model, so encoding it fails
         mock_envelope = MagicMock()
-        mock_envelope.dict.side_effect = Exception("Serialization failed")
         
         with pytest.raises(MessageSerializationError):
             serializer.serialize_message(mock_envelope)
@@ -137,20 +154,44 @@ class TestA2AMessageSerializer:
         with pytest.raises(MessageDeserializationError):
             serializer.deserialize_message(invalid_json)
     
-    def test_json_serializer_datetime(self):
-        """Test custom JSON serializer for datetime objects"""
-        from datetime import datetime
-        
-        serializer = A2AMessageSerializer()
-        
-        # Test datetime serialization
-        dt = datetime(2023, 1, 1, 12, 0, 0)
-        result = serializer._json_serializer(dt)
-        assert result == dt.isoformat()
+    def test_batch_round_trip(self):
+        """Test serializing several envelopes as one compressed batch"""
+        serializer = A2AMessageSerializer(compression_threshold=100)
+        envelopes = [
+            create_notification("agent1", "agent2", A2AMethod.HEARTBEAT, params={"seq": i})
+            for i in range(10)
+        ]
+        
+        batch_bytes = serializer.serialize_batch(envelopes)
+        
+        assert batch_bytes[:2] == b"\x1f\x8b"
+        result = serializer.deserialize_batch(batch_bytes)
+        assert [e.envelope_id for e in result] == [e.envelope_id for e in envelopes]
+        assert result[3].jsonrpc_message.params == {"seq": 3}
+    
+    @pytest.mark.asyncio
+    async def test_serialize_async_offloads_large_payloads(self):
+        """Test large payloads are compressed in a worker thread"""
+        serializer = A2AMessageSerializer(compression_threshold=100, offload_threshold=500)
+        small = create_capability_request("agent1", "agent2", "test", {"data": "x"})
+        large = create_capability_request("agent1", "agent2", "test", {"data": "x" * 1000})
+        
+        with patch("agents.messaging.asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+            assert await serializer.serialize_message_async(small) == serializer.serialize_message(small)
+            to_thread.assert_not_called()
+            
+            message_bytes = await serializer.serialize_message_async(large)
+            to_thread.assert_called_once()
+        
+        assert serializer.deserialize_message(message_bytes).envelope_id == large.envelope_id
+    
+    def test_serialize_datetime_isoformat(self):
+        """Test that datetimes are serialized in ISO format"""
+        serializer = A2AMessageSerializer(enable_compression=False)
+        envelope = create_notification("a", "b", "agent_status")
         
-        # Test unsupported object
-        with pytest.raises(TypeError):
-            serializer._json_serializer(object())
+        data = json.loads(serializer.serialize_message(envelope))
+        assert data["timestamp"] == envelope.timestamp.isoformat()
 
 
 class TestA2AMessageConverter:
@@ -408,6 +449,25 @@ class TestMessageRouter:
         assert result is not None
         assert result.sender_id == "agent2"
     
+    @pytest.mark.asyncio
+    async def test_send_many_delivers_batch(self, router):
+        """Test that a batch is sent once and each envelope is routed"""
+        transport_func = AsyncMock()
+        handler_func = AsyncMock()
+        router.register_handler("agent2", handler_func)
+        
+        envelopes = [
+            create_notification("agent1", "agent2", A2AMethod.HEARTBEAT, params={"seq": i})
+            for i in range(3)
+        ]
+        
+        await router.send_many(envelopes, transport_func)
+        transport_func.assert_called_once()
+        
+        await router.receive_many(transport_func.call_args[0][0])
+        assert handler_func.call_count == 3
+        assert handler_func.call_args[0][0].jsonrpc_message.params == {"seq": 2}
+    
     @pytest.mark.asyncio
     async def test_send_request_timeout(self, router):
         """Test request timeout handling"""
@@ -473,6 +533,93 @@ class TestMessageRouter:
         await router.receive_message(invalid_bytes)
 
 
+class TestMessageBatcher:
+    """Test windowed batching of outgoing messages"""
+    
+    @pytest.mark.asyncio
+    async def test_full_batch_is_sent_once(self):
+        """Test that reaching max_batch sends one batch per transport"""
+        router = MessageRouter()
+        batcher = MessageBatcher(router, max_batch=3, max_wait=60)
+        transport_func = AsyncMock()
+        batcher.start()
+        
+        for i in range(3):
+            await batcher.enqueue(
+                create_notification("agent1", "agent2", A2AMethod.HEARTBEAT, params={"seq": i}),
+                transport_func
+            )
+        await asyncio.sleep(0.01)
+        
+        transport_func.assert_called_once()
+        batch = router.serializer.deserialize_batch(transport_func.call_args[0][0])
+        assert [e.jsonrpc_message.params["seq"] for e in batch] == [0, 1, 2]
+        await batcher.stop()
+    
+    @pytest.mark.asyncio
+    async def test_lone_message_is_sent_at_deadline(self):
+        """Test that a single pending message is sent individually when the window ends"""
+        router = MessageRouter()
+        batcher = MessageBatcher(router, max_batch=50, max_wait=0.01)
+        transport_func = AsyncMock()
+        batcher.start()
+        
+        envelope = create_notification("agent1", "agent2", A2AMethod.HEARTBEAT)
+        await batcher.enqueue(envelope, transport_func)
+        await asyncio.sleep(0.05)
+        
+        transport_func.assert_called_once()
+        sent = router.serializer.deserialize_message(transport_func.call_args[0][0])
+        assert sent.envelope_id == envelope.envelope_id
+        await batcher.stop()
+    
+    @pytest.mark.asyncio
+    async def test_slow_transport_keeps_order_without_blocking_others(self):
+        """Test per-transport flush ordering while another transport is stalled"""
+        router = MessageRouter()
+        batcher = MessageBatcher(router, max_batch=2, max_wait=60)
+        release = asyncio.Event()
+        slow_batches = []
+        
+        async def slow_transport(message_bytes):
+            await release.wait()
+            slow_batches.append(router.serializer.deserialize_batch(message_bytes))
+        
+        fast_transport = AsyncMock()
+        batcher.start()
+        
+        for i in range(4):
+            await batcher.enqueue(
+                create_notification("agent1", "agent2", A2AMethod.HEARTBEAT, params={"seq": i}),
+                slow_transport
+            )
+        for i in range(2):
+            await batcher.enqueue(
+                create_notification("agent1", "agent3", A2AMethod.HEARTBEAT, params={"seq": i}),
+                fast_transport
+            )
+        await asyncio.sleep(0.01)
+        
+        # The fast transport is not held up by the stalled one
+        fast_transport.assert_called_once()
+        assert slow_batches == []
+        
+        release.set()
+        await batcher.stop()
+        assert [[e.jsonrpc_message.params["seq"] for e in batch] for batch in slow_batches] == [[0, 1], [2, 3]]
+    
+    @pytest.mark.asyncio
+    async def test_requests_are_rejected(self):
+        """Test that requests must go through send_message"""
+        batcher = MessageBatcher(MessageRouter())
+        request = create_capability_request(
+            sender_id="agent1", recipient_id="agent2", capability_name="test_capability", parameters={}
+        )
+        
+        with pytest.raises(ValueError):
+            await batcher.enqueue(request, AsyncMock())
+
+
 class TestGlobalRouterInstance:
     """Test global message router instance"""
     
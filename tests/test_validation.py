@@ -80,6 +80,14 @@ class TestValidationResult:
         assert len(result.errors) == 2
         assert len(result.warnings) == 2
         assert bool(result) is False
+    
+    def test_result_uses_slots(self):
+        """Test result instances carry no per-instance __dict__"""
+        result = ValidationResult()
+        
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(AttributeError):
+            result.unexpected = True
 
 
 class TestMessageValidator:
@@ -393,6 +401,22 @@ class TestMessageValidator:
             if i < 3:
                 assert result.is_valid is True
     
+    def test_rate_limit_senders_are_bounded(self, validator):
+        """Test that the least recently seen senders are evicted beyond the cap"""
+        validator.rate_limit_max_senders = 2
+        
+        for sender_id in ["agent1", "agent2", "agent1", "agent3"]:
+            envelope = create_capability_request(
+                sender_id=sender_id,
+                recipient_id="target",
+                capability_name="test_capability",
+                parameters={}
+            )
+            validator.validate_envelope(envelope)
+        
+        assert list(validator._agent_message_counts) == ["agent1", "agent3"]
+        assert len(validator._agent_message_counts["agent1"]) == 2
+    
     def test_payload_depth_validation(self, validator):
         """Test payload depth validation"""
         # Create deeply nested payload